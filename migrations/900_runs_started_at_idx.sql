@@ -0,0 +1,3 @@
+-- Latest-run lookups (SELECT run_id FROM runs ORDER BY started_at DESC LIMIT 1)
+-- read the newest row from this index instead of sorting the table.
+CREATE INDEX IF NOT EXISTS runs_started_at_idx ON runs (started_at DESC);
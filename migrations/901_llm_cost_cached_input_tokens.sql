@@ -0,0 +1,4 @@
+-- Cached prompt tokens (OpenAI prompt_tokens_details.cached_tokens) per call and per day,
+-- so prompt-cache hit rates can be read alongside cost.
+ALTER TABLE llm_cost_calls ADD COLUMN IF NOT EXISTS tokens_cached_input BIGINT NOT NULL DEFAULT 0;
+ALTER TABLE llm_cost_stage_daily ADD COLUMN IF NOT EXISTS tokens_cached_input BIGINT NOT NULL DEFAULT 0;
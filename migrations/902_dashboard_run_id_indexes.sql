@@ -0,0 +1,6 @@
+-- Dashboard lookups filter candidates by metadata->>'run_id' and aggregate
+-- llm_usage per (run_id, stage); the INCLUDE columns let the render-stats
+-- aggregate run as an index-only scan.
+CREATE INDEX IF NOT EXISTS candidates_run_id_idx ON candidates ((metadata->>'run_id'));
+CREATE INDEX IF NOT EXISTS llm_usage_run_id_stage_idx ON llm_usage (run_id, stage)
+    INCLUDE (latency_ms, tokens_prompt, tokens_completion);
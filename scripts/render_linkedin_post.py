@@ -5,20 +5,30 @@ import json
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 
-from lloyds_digest.ai.base import post_openai_chat_completion
+from lloyds_digest.ai.base import (
+    build_cache_key,
+    is_retryable_openai_error,
+    post_openai_chat_completion,
+)
 from lloyds_digest.ai.costing import compute_cost_usd
 from lloyds_digest.storage.postgres_repo import PostgresRepo
 from lloyds_digest.utils import load_env_file
 
 
-PROMPT_TEMPLATE = """You are my LinkedIn editor for the London Lloyd’s Market News Digest.
+# Static instructions go in the system message and the per-digest inputs in the
+# user message, so the long shared prefix is byte-identical across runs and
+# eligible for OpenAI's automatic prompt caching.
+SYSTEM_PROMPT = """You are my LinkedIn editor for the London Lloyd’s Market News Digest.
 
 TASK
 1) Read today’s public digest HTML file from this repo and extract the key content:
@@ -38,18 +48,8 @@ TASK
    - Avoids marketing fluff and avoids repeating the same point twice
    - Avoids “confidential/internal use” language (this is the public digest)
 
-INPUTS
-- Digest date: {run_date}
-- Public digest link: {public_link}
-
-EXECUTIVE SUMMARY
-{executive_summary}
-
-KEY THEMES
-{themes}
-
-HIGHLIGHTS
-{highlights}
+The digest inputs (date, public link, executive summary, key themes, highlights)
+follow in the user message.
 
 OUTPUT
 Return ONLY:
@@ -64,6 +64,22 @@ STYLE RULES
   when highlights are provided in the input.
 - If the digest includes regulatory warnings or scam-related items, include at most ONE and only if it’s clearly relevant to insurers/brokers.
 - Keep UK English spelling.
+
+Return only the final output. No markdown.
+"""
+
+PROMPT_TEMPLATE = """INPUTS
+- Digest date: {run_date}
+- Public digest link: {public_link}
+
+EXECUTIVE SUMMARY
+{executive_summary}
+
+KEY THEMES
+{themes}
+
+HIGHLIGHTS
+{highlights}
 """
 
 _GENERIC_PHRASES = (
@@ -84,22 +100,130 @@ _NOISE_TITLE_PATTERNS = (
     "page ",
 )
 
+_GENERIC_PHRASE_RE = re.compile("|".join(re.escape(phrase) for phrase in _GENERIC_PHRASES))
+_NOISE_TITLE_RE = re.compile("|".join(re.escape(pattern) for pattern in _NOISE_TITLE_PATTERNS))
+_TITLE_SUFFIX_RE = re.compile(r"\s*[-|]\s*(?:Business Insurance|Artemis\.bm)$", re.IGNORECASE)
+_DIGEST_DATE_RE = re.compile(r"digest_(\d{4}-\d{2}-\d{2})\.html$")
+_TITLE_KEY_RE = re.compile(r"[^a-z0-9]+")
+_BULLET_RE = re.compile(r"^(?:\d+\)|[-*])\s+(.*)$")
+# One pass over the model output: a leading "today's" becomes the digest date,
+# a lowercase word after a leading "DD-Mon's" is capitalised, lines ending in
+# ":" start with a capital, and the first word after any colon is capitalised.
+_FORMAT_RE = re.compile(
+    r"(?P<todays>\A(?i:today'?s)\b)(?P<todays_gap>\s+[a-z])?"
+    r"|(?P<lead>\A\d{2}-[A-Za-z]{3}'s\s+[a-z])"
+    r"|^(?P<indent>[^\S\n]*)(?P<heading>\w)(?=[^\n]*:[^\S\n]*$)"
+    r"|:(?P<colon_gap>\s*)(?P<token>[A-Za-z]\S*)",
+    re.MULTILINE,
+)
+_HEADING_TAIL_RE = re.compile(r"[^\n]*:[^\S\n]*$", re.MULTILINE)
+_LEAD_PREFIX_RE = re.compile(r"\d{2}-[A-Za-z]{3}")
+_URL_PREFIX_RE = re.compile(r"(?:https?://|www\.)", re.IGNORECASE)
+
+# Only the summary, themes list and story cards are read from a digest; skip
+# building nodes for the head, nav, styles and footer.
+_DIGEST_STRAINER = SoupStrainer(attrs={"class": re.compile(r"^(?:summary|themes|story)$")})
+
+
+PROMPT_VERSION = "v2"
+MAX_PROMPT_HIGHLIGHTS = 25
+RESPONSE_CACHE_DIR = Path("output") / "linkedin_cache"
+
+@dataclass(frozen=True)
+class LinkedInSettings:
+    openai_api_key: str
+    model: str
+    service_tier: str
+    fallback_tier: str
+    timeout: float
+    max_attempts: int
+    cache_ttl_hours: float
+    concurrency: int
+    pages_base_url: str
+    postgres_dsn: str | None
+
+    @classmethod
+    def from_env(cls) -> LinkedInSettings:
+        try:
+            postgres_dsn: str | None = _build_postgres_dsn_from_env()
+        except RuntimeError:
+            postgres_dsn = None
+        return cls(
+            openai_api_key=os.environ.get("OPENAI_API_KEY", ""),
+            model=os.environ.get(
+                "OPENAI_LINKEDIN_MODEL", os.environ.get("OPENAI_MODEL", "gpt-5.4-mini")
+            ),
+            service_tier=os.environ.get("OPENAI_LINKEDIN_SERVICE_TIER", "flex").strip() or "flex",
+            fallback_tier=(
+                os.environ.get("OPENAI_FALLBACK_SERVICE_TIER", "standard").strip() or "standard"
+            ),
+            timeout=float(os.environ.get("OPENAI_LINKEDIN_TIMEOUT", "600")),
+            max_attempts=int(os.environ.get("OPENAI_LINKEDIN_RETRIES", "3")),
+            cache_ttl_hours=float(os.environ.get("OPENAI_LINKEDIN_CACHE_TTL_HOURS", "24")),
+            concurrency=int(os.environ.get("LINKEDIN_CONCURRENCY", "4")),
+            pages_base_url=os.environ.get(
+                "GITHUB_PAGES_BASE_URL",
+                "https://poovannanrajendran.github.io/lloyds-market-news-digest/digests/",
+            ),
+            postgres_dsn=postgres_dsn,
+        )
+
+
+@cache
+def _settings() -> LinkedInSettings:
+    # Snapshot on first use, which is after main() has loaded .env.
+    return LinkedInSettings.from_env()
+
+
+# Postgres usage/timing writes run here so they overlap with printing and
+# writing the post; main() drains the queue before exiting.
+_TELEMETRY_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telemetry")
+
 
 def main() -> None:
     load_env_file(Path(".env"))
     args = _parse_args()
+    try:
+        if args.digest_paths:
+            _render_batch([Path(path) for path in args.digest_paths])
+            return
 
-    digest_path = Path(args.digest_path) if args.digest_path else _find_latest_digest()
-    if not digest_path or not digest_path.exists():
-        print("Digest file not found. Run the pipeline/render step first.")
+        digest_path = Path(args.digest_path) if args.digest_path else _find_latest_digest()
+        if not digest_path or not digest_path.exists():
+            print("Digest file not found. Run the pipeline/render step first.")
+            return
+        _render_digest(digest_path, stream=True)
+    finally:
+        _TELEMETRY_EXECUTOR.shutdown(wait=True)
+
+
+def _render_batch(digest_paths: list[Path]) -> None:
+    existing = []
+    for path in digest_paths:
+        if path.exists():
+            existing.append(path)
+        else:
+            print(f"Digest file not found: {path}")
+    if not existing:
         return
-
+    # One interpreter for the whole backfill; the OpenAI calls are I/O bound so
+    # a small thread pool overlaps them.
+    workers = max(1, min(len(existing), _settings().concurrency))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_render_digest, path): path for path in existing}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as exc:
+                print(f"Failed to render LinkedIn post for {futures[future].name}: {exc}")
+
+
+def _render_digest(digest_path: Path, stream: bool = False) -> None:
     digest_date = _extract_date(digest_path.name)
     if digest_date is None:
         digest_date = datetime.now().date().isoformat()
 
-    html = digest_path.read_text(encoding="utf-8")
-    parsed = _parse_digest(html)
+    parsed = _parse_digest(digest_path.read_bytes())
 
     public_link = _build_public_link(digest_path.name)
     prompt = PROMPT_TEMPLATE.format(
@@ -107,11 +231,14 @@ def main() -> None:
         public_link=public_link,
         executive_summary=parsed["executive_summary"] or "N/A",
         themes="\n".join(f"- {theme}" for theme in parsed["themes"]) or "N/A",
-        highlights="\n".join(parsed["highlights"]) or "N/A",
+        highlights=parsed["highlights"] or "N/A",
     )
 
+    if _settings().postgres_dsn:
+        # Resolve the (cached) run id on the telemetry thread while OpenAI is working.
+        _TELEMETRY_EXECUTOR.submit(_latest_run_id)
     render_start = datetime.now(timezone.utc)
-    response = _generate_with_openai(prompt)
+    response, llm_call = _generate_with_openai(prompt, stream=stream)
     if not response:
         print("Failed to generate LinkedIn post. Check OPENAI_API_KEY.")
         return
@@ -127,49 +254,76 @@ def main() -> None:
     out_path = output_dir / f"linkedin_post_{digest_date}.txt"
     out_path.write_text(formatted.strip() + "\n", encoding="utf-8")
     print(f"\nWrote {out_path}")
-    _log_phase_timing("render_linkedin", render_start, datetime.now(timezone.utc))
+    if _settings().postgres_dsn:
+        _TELEMETRY_EXECUTOR.submit(
+            _record_render_telemetry, llm_call, render_start, datetime.now(timezone.utc)
+        )
 
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate a LinkedIn post from a digest HTML file.")
-    parser.add_argument(
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument(
         "--digest-path",
         type=str,
         default="",
         help="Path to digest HTML file (defaults to latest in docs/digests or output).",
     )
+    target.add_argument(
+        "--digest-paths",
+        nargs="+",
+        default=[],
+        help="Render several digest HTML files in one run (e.g. a weekly backfill).",
+    )
     return parser.parse_args()
 
 
 def _find_latest_digest() -> Path | None:
-    candidates = []
+    candidates: list[os.DirEntry[str]] = []
     for base in (Path("docs") / "digests", Path("output")):
-        if not base.exists():
+        try:
+            entries = os.scandir(base)
+        except FileNotFoundError:
             continue
-        candidates.extend(base.glob("digest_*.html"))
+        with entries:
+            candidates.extend(
+                entry
+                for entry in entries
+                if entry.name.startswith("digest_") and entry.name.endswith(".html")
+            )
 
     dated = []
-    for path in candidates:
-        date = _extract_date(path.name)
+    for entry in candidates:
+        date = _extract_date(entry.name)
         if date:
-            dated.append((date, path))
+            dated.append((date, entry))
 
     if dated:
-        dated.sort(key=lambda pair: pair[0], reverse=True)
-        return dated[0][1]
+        return Path(max(dated, key=lambda pair: pair[0])[1].path)
 
     if candidates:
-        return max(candidates, key=lambda p: p.stat().st_mtime)
+        # DirEntry caches its stat result, so this does not re-stat each file.
+        return Path(max(candidates, key=lambda entry: entry.stat().st_mtime).path)
     return None
 
 
 def _extract_date(filename: str) -> str | None:
-    match = re.search(r"digest_(\d{4}-\d{2}-\d{2})\.html$", filename)
+    match = _DIGEST_DATE_RE.search(filename)
     return match.group(1) if match else None
 
 
-def _parse_digest(html: str) -> dict[str, Any]:
-    soup = BeautifulSoup(html, "html.parser")
+def _parse_digest(markup: str | bytes) -> dict[str, Any]:
+    # Byte input is decoded by the parser itself; digests are always written as UTF-8.
+    from_encoding = None if isinstance(markup, str) else "utf-8"
+    try:
+        soup = BeautifulSoup(
+            markup, "lxml", parse_only=_DIGEST_STRAINER, from_encoding=from_encoding
+        )
+    except FeatureNotFound:
+        # lxml is optional at runtime; the builder lookup fails before markup is read.
+        soup = BeautifulSoup(
+            markup, "html.parser", parse_only=_DIGEST_STRAINER, from_encoding=from_encoding
+        )
     summary = ""
     summary_node = soup.select_one(".summary")
     if summary_node:
@@ -181,32 +335,43 @@ def _parse_digest(html: str) -> dict[str, Any]:
         if text:
             themes.append(text)
 
-    highlights = []
+    # Flat list of prompt lines for the first MAX_PROMPT_HIGHLIGHTS stories,
+    # joined once and returned as the prompt-ready highlights block.
+    highlights: list[str] = []
     stories: list[dict[str, Any]] = []
-    for story in soup.select("article.story"):
-        title_node = story.select_one("h3 a")
+    for index, story in enumerate(soup.select("article.story")):
+        # Story cards are flat (h3, .meta, .why, ul are direct children), so one
+        # walk over the children picks up every field.
+        title_node = source = why_node = bullet_list = None
+        for child in story.find_all(True, recursive=False):
+            classes = child.get("class") or ()
+            if child.name == "h3":
+                title_node = title_node or child.a
+            elif "meta" in classes:
+                source = source or child
+            elif "why" in classes:
+                why_node = why_node or child
+            elif child.name == "ul":
+                bullet_list = bullet_list or child
         title = _clean_title(title_node.get_text(strip=True) if title_node else "Untitled")
         url = title_node["href"] if title_node and title_node.has_attr("href") else ""
-        source = story.select_one(".meta")
-        source_text = source.get_text(strip=True).replace("Source:", "").strip() if source else ""
-        why_node = story.select_one(".why")
+        source_text = source.get_text(strip=True).removeprefix("Source:").strip() if source else ""
         why_text = ""
         if why_node:
-            why_text = why_node.get_text(" ", strip=True).replace("Why it matters:", "").strip()
+            why_text = why_node.get_text(" ", strip=True).removeprefix("Why it matters:").strip()
             why_text = _clean_text(why_text)
-        bullets = [li.get_text(strip=True) for li in story.select("ul li") if li.get_text(strip=True)]
+        bullet_items = bullet_list.find_all("li", recursive=False) if bullet_list else []
+        bullets = [text for li in bullet_items if (text := li.get_text(strip=True))]
         bullets = [_clean_text(item) for item in bullets if item]
 
-        highlight_lines = [
-            f"- Title: {title}",
-            f"  Source: {source_text}" if source_text else "  Source: N/A",
-            f"  URL: {url}" if url else "  URL: N/A",
-        ]
-        if why_text:
-            highlight_lines.append(f"  Why: {why_text}")
-        if bullets:
-            highlight_lines.append(f"  Bullets: {', '.join(bullets)}")
-        highlights.append("\n".join(highlight_lines))
+        if index < MAX_PROMPT_HIGHLIGHTS:
+            highlights.append(f"- Title: {title}")
+            highlights.append(f"  Source: {source_text}" if source_text else "  Source: N/A")
+            highlights.append(f"  URL: {url}" if url else "  URL: N/A")
+            if why_text:
+                highlights.append(f"  Why: {why_text}")
+            if bullets:
+                highlights.append(f"  Bullets: {', '.join(bullets)}")
         stories.append(
             {
                 "title": title,
@@ -214,41 +379,48 @@ def _parse_digest(html: str) -> dict[str, Any]:
                 "source": source_text,
                 "why": why_text,
                 "bullets": bullets,
+                # Lowercased copies reused by the noise/score/dedupe helpers.
+                "_title_lower": title.lower(),
+                "_source_lower": source_text.lower(),
+                "_url_lower": url.lower(),
             }
         )
 
     return {
         "executive_summary": summary,
         "themes": themes,
-        "highlights": highlights[:25],
+        "highlights": "\n".join(highlights),
         "stories": stories,
     }
 
 
 def _clean_text(text: str) -> str:
-    cleaned = re.sub(r"\s+", " ", text or "").strip()
+    cleaned = " ".join((text or "").split())
     return cleaned.strip(" -,:;.")
 
 
 def _clean_title(title: str) -> str:
-    cleaned = _clean_text(title)
-    cleaned = re.sub(r"\s*[-|]\s*Business Insurance$", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s*[-|]\s*Artemis\.bm$", "", cleaned, flags=re.IGNORECASE)
-    return cleaned
+    return _TITLE_SUFFIX_RE.sub("", _clean_text(title))
 
 
 def _is_generic_text(text: str) -> bool:
-    low = text.lower()
-    return any(phrase in low for phrase in _GENERIC_PHRASES)
+    return _GENERIC_PHRASE_RE.search(text.lower()) is not None
+
+
+def _lower_field(story: dict[str, Any], field: str) -> str:
+    cached = story.get(f"_{field}_lower")
+    if cached is not None:
+        return cached
+    return (story.get(field) or "").lower()
 
 
 def _is_noise_story(story: dict[str, Any]) -> bool:
-    title = (story.get("title") or "").lower()
-    source = (story.get("source") or "").lower()
-    url = (story.get("url") or "").lower()
+    title = _lower_field(story, "title")
+    source = _lower_field(story, "source")
+    url = _lower_field(story, "url")
     if not title:
         return True
-    if any(pattern in title for pattern in _NOISE_TITLE_PATTERNS):
+    if _NOISE_TITLE_RE.search(title):
         return True
     if "newsnow.co.uk" in source or "newsnow.co.uk" in url:
         return True
@@ -259,8 +431,8 @@ def _is_noise_story(story: dict[str, Any]) -> bool:
 
 def _score_story(story: dict[str, Any]) -> int:
     score = 0
-    source = (story.get("source") or "").lower()
-    title = (story.get("title") or "").lower()
+    source = _lower_field(story, "source")
+    title = _lower_field(story, "title")
     why = story.get("why") or ""
     if source in {"fca.org.uk", "ldc.lloyds.com"}:
         score += 5
@@ -274,7 +446,7 @@ def _score_story(story: dict[str, Any]) -> int:
 
 
 def _select_relevant_stories(stories: list[dict[str, Any]], limit: int = 8) -> list[dict[str, Any]]:
-    clean: list[dict[str, Any]] = []
+    scored: list[tuple[int, dict[str, Any]]] = []
     seen: set[str] = set()
     for story in stories:
         if _is_noise_story(story):
@@ -282,22 +454,30 @@ def _select_relevant_stories(stories: list[dict[str, Any]], limit: int = 8) -> l
         title = _clean_title(story.get("title", ""))
         if not title:
             continue
-        key = re.sub(r"[^a-z0-9]+", "", title.lower())
+        title_lower = story.get("_title_lower") if title == story.get("title") else None
+        if title_lower is None:
+            title_lower = title.lower()
+        key = _TITLE_KEY_RE.sub("", title_lower)
         if not key or key in seen:
             continue
         seen.add(key)
         normalized = dict(story)
         normalized["title"] = title
+        normalized["_title_lower"] = title_lower
         normalized["why"] = _clean_text(story.get("why", ""))
         normalized["bullets"] = [item for item in (story.get("bullets") or []) if item]
-        clean.append(normalized)
-    clean.sort(key=_score_story, reverse=True)
-    return clean[:limit]
+        scored.append((_score_story(normalized), normalized))
+    # Stable sort, so equally scored stories keep digest order.
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    return [story for _, story in scored[:limit]]
 
 
 def _extract_post_highlight_lines(text: str) -> list[str]:
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    return [re.sub(r"^(?:\d+\)|[-*])\s*", "", line).strip() for line in lines if re.match(r"^(?:\d+\)|[-*])\s+", line)]
+    return [
+        match.group(1).strip()
+        for line in text.splitlines()
+        if (match := _BULLET_RE.match(line.strip()))
+    ]
 
 
 def _first_line(text: str) -> str:
@@ -312,8 +492,17 @@ def _contains_public_link(text: str, public_link: str) -> bool:
     return public_link in text
 
 
+def _relevant_stories(parsed: dict[str, Any]) -> list[dict[str, Any]]:
+    # The fallback check and the fallback post need the same selection; keep it on parsed.
+    selected = parsed.get("_selected")
+    if selected is None:
+        selected = _select_relevant_stories(parsed.get("stories", []), limit=8)
+        parsed["_selected"] = selected
+    return selected
+
+
 def _should_use_fallback_post(post_text: str, parsed: dict[str, Any], public_link: str) -> bool:
-    selected = _select_relevant_stories(parsed.get("stories", []), limit=8)
+    selected = _relevant_stories(parsed)
     available_count = len(selected)
     if available_count == 0:
         return False
@@ -376,7 +565,7 @@ def _build_fallback_why(parsed: dict[str, Any], stories: list[dict[str, Any]]) -
 
 
 def _build_fallback_post(parsed: dict[str, Any], digest_date: str, public_link: str) -> str:
-    stories = _select_relevant_stories(parsed.get("stories", []), limit=8)
+    stories = _relevant_stories(parsed)
     highlights = stories[:4]
     while len(highlights) < 4 and parsed.get("themes"):
         idx = len(highlights)
@@ -423,65 +612,75 @@ def _build_fallback_post(parsed: dict[str, Any], digest_date: str, public_link:
 
 
 def _build_public_link(filename: str) -> str:
-    base_url = os.environ.get(
-        "GITHUB_PAGES_BASE_URL",
-        "https://poovannanrajendran.github.io/lloyds-market-news-digest/digests/",
-    )
-    return f"{base_url}{filename}"
+    return f"{_settings().pages_base_url}{filename}"
 
 
 def _format_linkedin_response(text: str, digest_date: str) -> str:
-    output = text.strip()
-    output = _replace_lead_todays(output, digest_date)
-    output = re.sub(
-        r"^(\d{2}-[A-Za-z]{3}'s\s+)([a-z])",
-        lambda m: f"{m.group(1)}{m.group(2).upper()}",
-        output,
-        count=1,
-    )
-    output = _capitalize_heading_lines(output)
-    output = re.sub(r":\s*([A-Za-z][^\s]*)", _capitalize_after_colon, output)
-    return output
-
-
-def _replace_lead_todays(text: str, digest_date: str) -> str:
     try:
         prefix = datetime.strptime(digest_date, "%Y-%m-%d").strftime("%d-%b")
     except ValueError:
         prefix = digest_date
-    replacement = f"{prefix}'s"
-    return re.sub(r"^\s*today'?s\b", replacement, text, count=1, flags=re.IGNORECASE)
-
-
-def _capitalize_heading_lines(text: str) -> str:
-    lines = text.splitlines()
-    out_lines = []
-    for line in lines:
-        stripped = line.strip()
-        if stripped and stripped.endswith(":") and not stripped.startswith(("#", "-", "*", "1.", "2.", "3.", "4.", "5.")):
-            out_lines.append(line[: len(line) - len(stripped)] + stripped[:1].upper() + stripped[1:])
-            continue
-        out_lines.append(line)
-    return "\n".join(out_lines)
-
 
-def _capitalize_after_colon(match: re.Match[str]) -> str:
-    token = match.group(1)
-    if token.lower().startswith(("http://", "https://", "www.")):
-        return f": {token}"
-    return f": {token[:1].upper()}{token[1:]}"
-
-
-def _generate_with_openai(prompt: str) -> str:
-    api_key = os.environ.get("OPENAI_API_KEY", "")
-    model = os.environ.get("OPENAI_LINKEDIN_MODEL", os.environ.get("OPENAI_MODEL", "gpt-5.4-mini"))
+    def _format_match(match: re.Match[str]) -> str:
+        kind = match.lastgroup
+        if kind in ("todays", "todays_gap"):
+            lead = f"{prefix}'s"
+            if _HEADING_TAIL_RE.match(match.string, match.end("todays")):
+                lead = lead[:1].upper() + lead[1:]
+            gap = match.group("todays_gap") or ""
+            if gap and (
+                _LEAD_PREFIX_RE.fullmatch(prefix)
+                or ("\n" in gap and _HEADING_TAIL_RE.match(match.string, match.end() - 1))
+            ):
+                gap = gap[:-1] + gap[-1].upper()
+            return lead + gap
+        if kind == "lead":
+            return match.group(0)[:-1] + match.group(0)[-1].upper()
+        if kind == "heading":
+            return match.group("indent") + match.group("heading").upper()
+        token = match.group("token")
+        if _URL_PREFIX_RE.match(token):
+            # A colon at the end of one line can swallow the start of a heading line.
+            if "\n" in match.group("colon_gap") and _HEADING_TAIL_RE.match(
+                match.string, match.start("token")
+            ):
+                token = token[:1].upper() + token[1:]
+            return f": {token}"
+        return f": {token[:1].upper()}{token[1:]}"
+
+    return _FORMAT_RE.sub(_format_match, text.strip())
+
+
+def _generate_with_openai(prompt: str, stream: bool = False) -> tuple[str, dict[str, Any] | None]:
+    """Return the model output and, for a live call, the usage to record for it.
+
+    With stream=True the draft is echoed to stdout as it arrives (single-digest runs
+    only; batch renders would interleave).
+    """
+    settings = _settings()
+    api_key = settings.openai_api_key
+    model = settings.model
+    cache_key = build_cache_key(model, PROMPT_VERSION, prompt)
+    cached = _read_cached_response(cache_key)
+    if cached:
+        print(f"Using cached OpenAI response ({cache_key[:12]})", flush=True)
+        return cached, None
     if not api_key:
-        return ""
-    use_temperature = not model.startswith("gpt-5")
-    service_tier = os.environ.get("OPENAI_LINKEDIN_SERVICE_TIER", "flex").strip() or "flex"
-    timeout = float(os.environ.get("OPENAI_LINKEDIN_TIMEOUT", "600"))
-    max_attempts = int(os.environ.get("OPENAI_LINKEDIN_RETRIES", "3"))
-    fallback_tier = os.environ.get("OPENAI_FALLBACK_SERVICE_TIER", "standard").strip() or "standard"
+        return "", None
+    # Nothing below changes between attempts, so build the request arguments up front.
+    service_tier = settings.service_tier
+    timeout = settings.timeout
+    max_attempts = settings.max_attempts
+    request_kwargs: dict[str, Any] = {
+        "model": model,
+        "api_key": api_key,
+        "service_tier": service_tier,
+        "fallback_tier": settings.fallback_tier,
+        "timeout": timeout,
+        "system_prompt": SYSTEM_PROMPT,
+        "temperature": None if model.startswith("gpt-5") else 0.3,
+        "on_delta": (lambda delta: print(delta, end="", flush=True)) if stream else None,
+    }
     for attempt in range(1, max_attempts + 1):
         try:
             print(
@@ -490,155 +689,146 @@ def _generate_with_openai(prompt: str) -> str:
                 flush=True,
             )
             started = time.time()
-            result = post_openai_chat_completion(
-                prompt,
-                model=model,
-                api_key=api_key,
-                service_tier=service_tier,
-                fallback_tier=fallback_tier,
-                timeout=timeout,
-                system_prompt="Return only the final output. No markdown.",
-                temperature=0.3 if use_temperature else None,
-            )
+            result = post_openai_chat_completion(prompt, **request_kwargs)
             data = result["data"]
             used_tier = result["service_tier"]
             content = data["choices"][0]["message"]["content"]
             output_text = content.strip()
             usage = data.get("usage", {}) if isinstance(data, dict) else {}
             elapsed = time.time() - started
+            if stream:
+                print()
             print(f"OpenAI request done in {elapsed:.1f}s", flush=True)
-            _record_llm_usage_and_cost(
-                model=model,
-                prompt=prompt,
-                output_text=output_text,
-                service_tier=used_tier,
-                tokens_prompt=usage.get("prompt_tokens"),
-                tokens_completion=usage.get("completion_tokens"),
-                tokens_cached_input=((usage.get("prompt_tokens_details") or {}).get("cached_tokens")),
+            tokens_cached_input = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+            # Shows whether the static system prompt prefix is hitting OpenAI's prompt cache.
+            print(
+                f"cached_prompt_tokens={tokens_cached_input or 0}"
+                f" / prompt_tokens={usage.get('prompt_tokens')}"
             )
-            return output_text
+            llm_call = {
+                "model": model,
+                "service_tier": used_tier,
+                "tokens_prompt": usage.get("prompt_tokens"),
+                "tokens_completion": usage.get("completion_tokens"),
+                "tokens_cached_input": tokens_cached_input,
+            }
+            _write_cached_response(cache_key, output_text)
+            return output_text, llm_call
         except Exception as exc:
-            if attempt == max_attempts:
+            if attempt == max_attempts or not is_retryable_openai_error(exc):
                 raise
             sleep_s = 2**attempt
             print(f"OpenAI call failed (attempt {attempt}): {exc}. Retrying in {sleep_s}s...")
             time.sleep(sleep_s)
-    return ""
+    return "", None
 
 
-def _record_llm_usage_and_cost(
-    model: str,
-    prompt: str,
-    output_text: str,
-    service_tier: str | None,
-    tokens_prompt: int | None = None,
-    tokens_completion: int | None = None,
-    tokens_cached_input: int | None = None,
-) -> None:
-    if tokens_prompt is None:
-        tokens_prompt = _estimate_tokens(prompt)
-    if tokens_completion is None:
-        tokens_completion = _estimate_tokens(output_text)
+def _read_cached_response(cache_key: str) -> str | None:
+    ttl_hours = _settings().cache_ttl_hours
+    if ttl_hours <= 0:
+        return None
+    path = RESPONSE_CACHE_DIR / f"{cache_key}.txt"
     try:
-        dsn = _build_postgres_dsn_from_env()
-    except Exception:
+        if time.time() - path.stat().st_mtime > ttl_hours * 3600:
+            return None
+        return path.read_text(encoding="utf-8") or None
+    except OSError:
+        return None
+
+
+def _write_cached_response(cache_key: str, text: str) -> None:
+    if not text:
         return
     try:
-        postgres = PostgresRepo(dsn)
-        run_id = _latest_run_id(postgres)
-        started_at = datetime.now()
-        postgres.insert_llm_usage(
-            run_id=run_id,
-            candidate_id=None,
-            stage="render_linkedin",
-            model=model,
-            prompt_version="v1",
-            cached=False,
-            started_at=started_at,
-            ended_at=started_at,
-            latency_ms=0,
-            tokens_prompt=tokens_prompt,
-            tokens_completion=tokens_completion,
-            metadata={"program": "render_linkedin_post.py"},
-        )
-        cost = compute_cost_usd(
-            model=model,
-            tokens_prompt=tokens_prompt,
-            tokens_completion=tokens_completion,
-            service_tier=service_tier,
-            tokens_cached_input=tokens_cached_input,
-        )
-        if cost is None:
-            return
-        input_cost, output_cost, total_cost = cost
-        postgres.insert_llm_cost_call(
-            run_id=run_id,
-            candidate_id=None,
-            stage="render_linkedin",
-            provider="openai",
-            model=model,
-            service_tier=service_tier,
-            tokens_prompt=tokens_prompt,
-            tokens_completion=tokens_completion,
-            cost_input_usd=input_cost,
-            cost_output_usd=output_cost,
-            cost_total_usd=total_cost,
-            metadata={"program": "render_linkedin_post.py"},
-        )
-        usage_date = datetime.now().date().isoformat()
-        postgres.upsert_llm_cost_stage_daily(
-            usage_date=usage_date,
-            stage="render_linkedin",
-            provider="openai",
-            model=model,
-            service_tier=service_tier,
-            calls=1,
-            tokens_prompt=tokens_prompt,
-            tokens_completion=tokens_completion,
-            cost_total_usd=total_cost,
-        )
-    except Exception:
+        RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (RESPONSE_CACHE_DIR / f"{cache_key}.txt").write_text(text, encoding="utf-8")
+    except OSError:
         return
 
 
-def _log_phase_timing(phase: str, started_at: datetime, ended_at: datetime) -> None:
-    try:
-        dsn = _build_postgres_dsn_from_env()
-    except Exception:
+def _record_render_telemetry(
+    llm_call: dict[str, Any] | None, started_at: datetime, ended_at: datetime
+) -> None:
+    postgres = _postgres_repo()
+    if postgres is None:
         return
     try:
-        postgres = PostgresRepo(dsn)
-        run_id = _latest_run_id(postgres)
-        if not run_id:
+        run_id = _latest_run_id()
+        if llm_call is not None and (
+            llm_call["tokens_prompt"] is None or llm_call["tokens_completion"] is None
+        ):
+            print("OpenAI response carried no token usage; skipping LLM cost logging.")
+            llm_call = None
+        if llm_call is None:
+            # Cached response (or no usage): no model call to record, only the phase timing.
+            if run_id:
+                postgres.insert_run_phase_timing(
+                    run_id=run_id,
+                    phase="render_linkedin",
+                    duration_ms=int((ended_at - started_at).total_seconds() * 1000),
+                    started_at=started_at,
+                    ended_at=ended_at,
+                    metadata={"program": "render_linkedin_post.py"},
+                )
             return
-        duration_ms = int((ended_at - started_at).total_seconds() * 1000)
-        postgres.insert_run_phase_timing(
-            run_id=run_id,
-            phase=phase,
-            duration_ms=duration_ms,
-            started_at=started_at,
-            ended_at=ended_at,
-            metadata={"program": "render_linkedin_post.py"},
+        _record_llm_usage_and_cost(
+            postgres, run_id, ("render_linkedin", started_at, ended_at), **llm_call
         )
     except Exception:
         return
 
 
-def _latest_run_id(postgres: PostgresRepo) -> str | None:
-    sql = "SELECT run_id FROM runs ORDER BY started_at DESC LIMIT 1"
-    with postgres._connect() as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql)
-            row = cur.fetchone()
-            if not row:
-                return None
-            return row[0]
+def _record_llm_usage_and_cost(
+    postgres: PostgresRepo,
+    run_id: str | None,
+    phase_timing: tuple[str, datetime, datetime],
+    model: str,
+    service_tier: str | None,
+    tokens_prompt: int,
+    tokens_completion: int,
+    tokens_cached_input: int | None = None,
+) -> None:
+    started_at = datetime.now()
+    cost = compute_cost_usd(
+        model=model,
+        tokens_prompt=tokens_prompt,
+        tokens_completion=tokens_completion,
+        service_tier=service_tier,
+        tokens_cached_input=tokens_cached_input,
+    )
+    # Usage, cost and the render phase timing go out in one transaction.
+    postgres.record_llm_call(
+        run_id=run_id,
+        candidate_id=None,
+        stage="render_linkedin",
+        provider="openai",
+        model=model,
+        prompt_version=PROMPT_VERSION,
+        service_tier=service_tier,
+        started_at=started_at,
+        ended_at=started_at,
+        latency_ms=0,
+        tokens_prompt=tokens_prompt,
+        tokens_completion=tokens_completion,
+        cost=cost,
+        usage_date=started_at.date().isoformat(),
+        metadata={"program": "render_linkedin_post.py"},
+        phase_timing=phase_timing,
+        tokens_cached_input=tokens_cached_input,
+    )
 
 
-def _estimate_tokens(text: str) -> int:
-    if not text:
-        return 0
-    return max(1, len(text) // 4)
+@cache
+def _postgres_repo() -> PostgresRepo | None:
+    dsn = _settings().postgres_dsn
+    return PostgresRepo(dsn) if dsn else None
+
+
+@cache
+def _latest_run_id() -> str | None:
+    # The latest run cannot change while this script runs; look it up once.
+    postgres = _postgres_repo()
+    return postgres.get_latest_run_id() if postgres else None
 
 
 def _build_postgres_dsn_from_env() -> str:
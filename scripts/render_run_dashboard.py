@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import argparse
-import html
+import hashlib
 import json
 import os
 from datetime import datetime, timedelta, timezone
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 import psycopg
 
@@ -14,40 +15,76 @@ from lloyds_digest.config import load_config
 from lloyds_digest.storage.mongo_repo import MongoRepo, MongoConfigError
 from lloyds_digest.utils import load_env_file
 
+_WRITE_BUFFER_SIZE = 64 * 1024
+_MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+# Same replacements as html.escape(quote=True), applied in one translate pass.
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
 
 def main() -> None:
     load_env_file(Path(".env"))
     config = load_config(Path("config.yaml"))
     args = _parse_args()
 
-    runs = _fetch_runs(limit=args.limit_runs)
-    if not runs:
-        print("No runs found.")
-        return
-
     output_dir = Path("output") / "dashboard"
-    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = output_dir / ".cache"
 
-    if args.run_id:
-        run = next((r for r in runs if r["run_id"] == args.run_id), None)
-        if not run:
-            print(f"Run not found: {args.run_id}")
+    # One connection for every query in this render.
+    with psycopg.connect(_dsn_from_env()) as conn:
+        runs = _fetch_runs(conn, limit=args.limit_runs)
+        if not runs:
+            print("No runs found.")
             return
-        html = _render_run_page(run, runs, config)
-        out_path = output_dir / f"run_{run['run_id']}.html"
-        out_path.write_text(html, encoding="utf-8")
-        print(f"Wrote {out_path}")
-        return
 
-    for run in runs:
-        html = _render_run_page(run, runs, config)
+        if args.run_id:
+            run = next((r for r in runs if r["run_id"] == args.run_id), None)
+            if not run:
+                print(f"Run not found: {args.run_id}")
+                return
+            targets = [run]
+        else:
+            targets = runs
+        page_keys = {run["run_id"]: _page_cache_key(run) for run in targets}
+        if not args.no_cache:
+            targets = [
+                run
+                for run in targets
+                if not _page_is_current(
+                    output_dir, cache_dir, run["run_id"], page_keys[run["run_id"]]
+                )
+            ]
+        run_data = _fetch_all_runs(conn, targets, config) if targets else {}
+    rejections = _fetch_rejections_bulk([run["run_id"] for run in targets]) if targets else None
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir.mkdir(exist_ok=True)
+    (output_dir / "dashboard.css").write_text(_DASHBOARD_CSS, encoding="utf-8")
+    # The run selector lists every run, so it lives outside the cached page bodies.
+    (output_dir / "runs.js").write_text(_render_runs_script(runs), encoding="utf-8")
+
+    for run in targets:
+        run_rejections = rejections[run["run_id"]] if rejections is not None else None
         out_path = output_dir / f"run_{run['run_id']}.html"
-        out_path.write_text(html, encoding="utf-8")
+        with open(out_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as fh:
+            _write_run_page(fh, run, run_data[run["run_id"]], run_rejections)
+        key_path = cache_dir / f"{run['run_id']}.key"
+        page_key = page_keys[run["run_id"]]
+        if page_key is None:
+            key_path.unlink(missing_ok=True)
+        else:
+            key_path.write_text(page_key, encoding="utf-8")
         print(f"Wrote {out_path}")
+    skipped = len(page_keys) - len(targets)
+    if skipped:
+        print(f"Skipped {skipped} unchanged run page(s)")
+    if args.run_id:
+        return
 
-    index_html = _render_index_page(runs)
     index_path = output_dir / "index.html"
-    index_path.write_text(index_html, encoding="utf-8")
+    with open(index_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as fh:
+        fh.write(_render_index_page(runs))
     print(f"Wrote {index_path}")
 
 
@@ -55,9 +92,33 @@ def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Render an HTML dashboard for recent runs.")
     parser.add_argument("--run-id", default="", help="Render only a single run ID.")
     parser.add_argument("--limit-runs", type=int, default=20, help="Number of recent runs to include.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-render every run page, e.g. after late telemetry for a finished run.",
+    )
     return parser.parse_args()
 
 
+def _page_cache_key(run: dict[str, Any]) -> str | None:
+    # In-progress runs are never cached: their pages show a live end time. The run
+    # selector lives in runs.js, so a new run does not invalidate older pages.
+    if run["ended_at"] is None:
+        return None
+    raw = f"{run['run_id']}|{run['ended_at'].isoformat()}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _page_is_current(output_dir: Path, cache_dir: Path, run_id: str, page_key: str | None) -> bool:
+    if page_key is None or not (output_dir / f"run_{run_id}.html").exists():
+        return False
+    try:
+        return (cache_dir / f"{run_id}.key").read_text(encoding="utf-8") == page_key
+    except FileNotFoundError:
+        return False
+
+
+@cache
 def _dsn_from_env() -> str:
     required = ["POSTGRES_HOST", "POSTGRES_PORT", "POSTGRES_DB", "POSTGRES_USER", "POSTGRES_PASSWORD"]
     missing = [key for key in required if not os.environ.get(key)]
@@ -72,7 +133,7 @@ def _dsn_from_env() -> str:
     )
 
 
-def _fetch_runs(limit: int) -> list[dict[str, Any]]:
+def _fetch_runs(conn: psycopg.Connection, limit: int) -> list[dict[str, Any]]:
     sql = """
         SELECT run_id, run_date, started_at, ended_at, metrics
         FROM runs
@@ -80,68 +141,214 @@ def _fetch_runs(limit: int) -> list[dict[str, Any]]:
         LIMIT %s
     """
     runs: list[dict[str, Any]] = []
-    with psycopg.connect(_dsn_from_env()) as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, (limit,))
-            for row in cur.fetchall():
-                run_id, run_date, started_at, ended_at, metrics = row
-                runs.append(
-                    {
-                        "run_id": run_id,
-                        "run_date": run_date,
-                        "started_at": started_at,
-                        "ended_at": ended_at,
-                        "metrics": metrics or {},
-                    }
-                )
+    with conn.cursor() as cur:
+        cur.execute(sql, (limit,))
+        for row in cur.fetchall():
+            run_id, run_date, started_at, ended_at, metrics = row
+            runs.append(
+                {
+                    "run_id": run_id,
+                    "run_date": run_date,
+                    "started_at": started_at,
+                    "ended_at": ended_at,
+                    "metrics": metrics or {},
+                }
+            )
     return runs
 
 
-def _run_counts(run: dict[str, Any], config) -> dict[str, Any]:
-    run_id = run["run_id"]
-    run_date = run["run_date"]
-    started_at = run["started_at"]
-    ended_at = run["ended_at"] or datetime.now(timezone.utc)
-    max_age_days = getattr(config, "filters", None).max_age_days if getattr(config, "filters", None) else 7
-    cutoff = datetime.combine(run_date, datetime.min.time(), tzinfo=timezone.utc) - timedelta(days=max_age_days)
+# Dashboard queries cover every rendered run at once (no per-run N+1). Each one
+# joins against the target runs unnested from parallel arrays, so per-run values
+# (time window, age cutoff) stay available, and tags its rows with run_id.
+_TARGET_RUNS_CTE = """
+    target_runs AS (
+        SELECT *
+        FROM unnest(
+            %(run_ids)s::text[], %(started_ats)s::timestamptz[],
+            %(ended_ats)s::timestamptz[], %(cutoffs)s::timestamptz[]
+        ) AS r(run_id, started_at, ended_at, cutoff)
+    )
+"""
 
-    sql_candidates = """
-        SELECT COUNT(*),
-               COUNT(*) FILTER (WHERE published_at IS NOT NULL AND published_at < %s) AS filtered_by_age
-        FROM candidates
-        WHERE metadata->>'run_id' = %s
-    """
-    sql_articles = """
-        SELECT COUNT(*) FROM articles
-        WHERE created_at >= %s AND created_at <= %s
-    """
-    sql_llm = """
-        SELECT stage, COUNT(*)
+# Candidate, article and per-stage LLM counts come back as rows tagged by source.
+_RUN_COUNTS_SQL = f"""
+    WITH {_TARGET_RUNS_CTE}
+    SELECT r.run_id, 'candidates', NULL, COUNT(*),
+           COUNT(*) FILTER (WHERE c.published_at IS NOT NULL AND c.published_at < r.cutoff)
+    FROM candidates c
+    JOIN target_runs r ON c.metadata->>'run_id' = r.run_id
+    GROUP BY r.run_id
+    UNION ALL
+    SELECT r.run_id, 'articles', NULL, COUNT(*), NULL
+    FROM articles a
+    JOIN target_runs r ON a.created_at >= r.started_at AND a.created_at <= r.ended_at
+    GROUP BY r.run_id
+    UNION ALL
+    SELECT run_id, 'llm', stage, COUNT(*), NULL
+    FROM llm_usage
+    WHERE run_id = ANY(%(run_ids)s::text[])
+    GROUP BY run_id, stage
+"""
+
+# Render stats tagged with the run_id; for runs with none (older renders logged
+# without one), fall back to render calls inside the run's time window.
+_RENDER_STATS_SQL = f"""
+    WITH {_TARGET_RUNS_CTE},
+    by_run AS (
+        SELECT run_id, stage, model, COUNT(*) AS calls, AVG(latency_ms) AS avg_latency,
+               SUM(tokens_prompt) AS tokens_prompt, SUM(tokens_completion) AS tokens_completion,
+               MAX(started_at) AS last_started_at
         FROM llm_usage
-        WHERE run_id = %s
-        GROUP BY stage
-    """
+        WHERE (stage LIKE 'render_%%' OR stage LIKE 'render_digest:%%')
+          AND run_id = ANY(%(run_ids)s::text[])
+        GROUP BY run_id, stage, model
+    ),
+    by_window AS (
+        SELECT r.run_id, u.stage, u.model, COUNT(*) AS calls, AVG(u.latency_ms) AS avg_latency,
+               SUM(u.tokens_prompt) AS tokens_prompt, SUM(u.tokens_completion) AS tokens_completion,
+               MAX(u.started_at) AS last_started_at
+        FROM target_runs r
+        JOIN llm_usage u ON u.started_at >= r.started_at AND u.started_at <= r.ended_at
+        WHERE (u.stage LIKE 'render_%%' OR u.stage LIKE 'render_digest:%%')
+          AND NOT EXISTS (SELECT 1 FROM by_run b WHERE b.run_id = r.run_id)
+        GROUP BY r.run_id, u.stage, u.model
+    )
+    SELECT run_id, stage, model, calls, avg_latency, tokens_prompt, tokens_completion
+    FROM (SELECT * FROM by_run UNION ALL SELECT * FROM by_window) AS stats
+    ORDER BY run_id, last_started_at DESC
+"""
 
-    with psycopg.connect(_dsn_from_env()) as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql_candidates, (cutoff, run_id))
-            total_candidates, filtered_by_age = cur.fetchone()
+_COSTS_SQL = """
+    SELECT usage_date, stage, provider, model, service_tier, calls, cost_total_usd
+    FROM llm_cost_stage_daily
+    WHERE usage_date = ANY(%(run_dates)s::date[])
+    ORDER BY cost_total_usd DESC
+"""
+
+_PHASE_TIMINGS_SQL = """
+    SELECT run_id, phase, started_at, ended_at, duration_ms
+    FROM run_phase_timings
+    WHERE run_id = ANY(%(run_ids)s::text[])
+    ORDER BY run_id, started_at NULLS LAST, phase
+"""
+
+_ATTEMPT_ERRORS_SQL = """
+    SELECT run_id, kind, method, status, error, url, source_id, started_at
+    FROM (
+        SELECT
+            c.metadata->>'run_id' AS run_id,
+            a.kind,
+            a.method,
+            a.status,
+            a.error,
+            c.url,
+            c.source_id,
+            a.started_at,
+            ROW_NUMBER() OVER (
+                PARTITION BY c.metadata->>'run_id' ORDER BY a.started_at DESC
+            ) AS rn
+        FROM attempts a
+        JOIN candidates c ON c.candidate_id = a.candidate_id
+        WHERE c.metadata->>'run_id' = ANY(%(run_ids)s::text[])
+          AND (a.status = 'ERROR' OR a.error IS NOT NULL)
+    ) AS errors
+    WHERE rn <= %(limit)s
+    ORDER BY run_id, started_at DESC
+"""
 
-            cur.execute(sql_articles, (started_at, ended_at))
-            total_articles = cur.fetchone()[0]
+_ATTEMPT_ERRORS_TIMEOUT_SQL = "SET LOCAL statement_timeout = '5s'"
 
-            cur.execute(sql_llm, (run_id,))
-            llm_counts = {stage: count for stage, count in cur.fetchall()}
 
-    return {
-        "total_candidates": total_candidates,
-        "filtered_by_age": filtered_by_age,
-        "total_articles": total_articles,
-        "llm_counts": llm_counts,
+def _fetch_all_runs(
+    conn: psycopg.Connection, runs: list[dict[str, Any]], config
+) -> dict[str, dict[str, Any]]:
+    max_age_days = getattr(config, "filters", None).max_age_days if getattr(config, "filters", None) else 7
+    now = datetime.now(timezone.utc)
+    params = {
+        "run_ids": [run["run_id"] for run in runs],
+        "run_dates": [run["run_date"] for run in runs],
+        "started_ats": [run["started_at"] for run in runs],
+        "ended_ats": [run["ended_at"] or now for run in runs],
+        "cutoffs": [
+            datetime.combine(run["run_date"], datetime.min.time(), tzinfo=timezone.utc)
+            - timedelta(days=max_age_days)
+            for run in runs
+        ],
+        "limit": 25,
+    }
+
+    with (
+        conn.cursor() as counts_cur,
+        conn.cursor() as render_cur,
+        conn.cursor() as costs_cur,
+        conn.cursor() as phase_cur,
+    ):
+        # Send every query before reading any result: one round trip for the whole render.
+        with conn.pipeline():
+            counts_cur.execute(_RUN_COUNTS_SQL, params)
+            render_cur.execute(_RENDER_STATS_SQL, params)
+            costs_cur.execute(_COSTS_SQL, params)
+            phase_cur.execute(_PHASE_TIMINGS_SQL, params)
+        counts_rows = counts_cur.fetchall()
+        render_rows = render_cur.fetchall()
+        cost_rows = costs_cur.fetchall()
+        phase_rows = phase_cur.fetchall()
+    error_rows = _fetch_attempt_errors(conn, params)
+
+    data = {
+        run["run_id"]: {
+            "counts": {
+                "total_candidates": 0,
+                "filtered_by_age": 0,
+                "total_articles": 0,
+                "llm_counts": {},
+            },
+            "render_stats": {"rows": []},
+            "costs": [],
+            "phase_rows": [],
+            "attempt_errors": [],
+        }
+        for run in runs
     }
+    for run_id, tag, stage, count, filtered in counts_rows:
+        counts = data[run_id]["counts"]
+        if tag == "candidates":
+            counts["total_candidates"], counts["filtered_by_age"] = count, filtered
+        elif tag == "articles":
+            counts["total_articles"] = count
+        else:
+            counts["llm_counts"][stage] = count
+    for run_id, *row in render_rows:
+        data[run_id]["render_stats"]["rows"].append(tuple(row))
+    costs_by_date: dict[Any, list[tuple[Any, ...]]] = {}
+    for row in cost_rows:
+        costs_by_date.setdefault(row[0], []).append(row)
+    for run in runs:
+        data[run["run_id"]]["costs"] = costs_by_date.get(run["run_date"], [])
+    for run_id, *row in phase_rows:
+        data[run_id]["phase_rows"].append(tuple(row))
+    for run_id, *row in error_rows:
+        data[run_id]["attempt_errors"].append(tuple(row))
+    return data
+
+
+def _fetch_attempt_errors(
+    conn: psycopg.Connection, params: dict[str, Any]
+) -> list[tuple[Any, ...]]:
+    # The attempts/candidates join is the only unbounded scan. Cap it inside its own savepoint
+    # so a timeout only blanks the error tables instead of aborting the whole render.
+    try:
+        with conn.transaction(), conn.cursor() as cur:
+            cur.execute(_ATTEMPT_ERRORS_TIMEOUT_SQL)
+            cur.execute(_ATTEMPT_ERRORS_SQL, params)
+            rows = cur.fetchall()
+            cur.execute("SET LOCAL statement_timeout TO DEFAULT")
+            return rows
+    except psycopg.errors.QueryCanceled:
+        return []
 
 
-def _fetch_rejections(run_id: str) -> dict[str, int] | None:
+def _fetch_rejections_bulk(run_ids: list[str]) -> dict[str, dict[str, int]] | None:
     try:
         mongo = MongoRepo.from_env()
     except MongoConfigError:
@@ -149,226 +356,154 @@ def _fetch_rejections(run_id: str) -> dict[str, int] | None:
     try:
         collection = mongo._collection("rejections")
         pipeline = [
-            {"$match": {"run_id": run_id}},
-            {"$group": {"_id": "$stage", "count": {"$sum": 1}}},
+            {"$match": {"run_id": {"$in": run_ids}}},
+            {"$group": {"_id": {"run_id": "$run_id", "stage": "$stage"}, "count": {"$sum": 1}}},
         ]
-        results = collection.aggregate(pipeline)
-        return {item["_id"]: int(item["count"]) for item in results}
+        rejections: dict[str, dict[str, int]] = {run_id: {} for run_id in run_ids}
+        for item in collection.aggregate(pipeline):
+            rejections[item["_id"]["run_id"]][item["_id"]["stage"]] = int(item["count"])
+        return rejections
     except Exception:
         return None
 
 
-def _fetch_render_stats(run_id: str, run_started_at: datetime, run_ended_at: datetime) -> dict[str, Any]:
-    sql = """
-        SELECT stage, model, COUNT(*), AVG(latency_ms), SUM(tokens_prompt), SUM(tokens_completion)
-        FROM llm_usage
-        WHERE (stage LIKE 'render_%%' OR stage LIKE 'render_digest:%%')
-          AND run_id = %s
-        GROUP BY stage, model
-        ORDER BY MAX(started_at) DESC
-    """
-    rows = []
-    with psycopg.connect(_dsn_from_env()) as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, (run_id,))
-            for row in cur.fetchall():
-                rows.append(row)
-    if rows:
-        return {"rows": rows}
-    sql = """
-        SELECT stage, model, COUNT(*), AVG(latency_ms), SUM(tokens_prompt), SUM(tokens_completion)
-        FROM llm_usage
-        WHERE (stage LIKE 'render_%%' OR stage LIKE 'render_digest:%%')
-          AND started_at >= %s AND started_at <= %s
-        GROUP BY stage, model
-        ORDER BY MAX(started_at) DESC
-    """
-    with psycopg.connect(_dsn_from_env()) as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, (run_started_at, run_ended_at))
-            for row in cur.fetchall():
-                rows.append(row)
-    return {"rows": rows}
-
-
-def _fetch_costs(run_date: datetime.date) -> list[tuple[Any, ...]]:
-    sql = """
-        SELECT usage_date, stage, provider, model, service_tier, calls, cost_total_usd
-        FROM llm_cost_stage_daily
-        WHERE usage_date = %s
-        ORDER BY cost_total_usd DESC
-    """
-    with psycopg.connect(_dsn_from_env()) as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, (run_date,))
-            return cur.fetchall()
-
-
-def _fetch_phase_timings(run_id: str) -> list[tuple[Any, ...]]:
-    sql = """
-        SELECT phase, started_at, ended_at, duration_ms
-        FROM run_phase_timings
-        WHERE run_id = %s
-        ORDER BY started_at NULLS LAST, phase
-    """
-    with psycopg.connect(_dsn_from_env()) as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, (run_id,))
-            return cur.fetchall()
+_DASHBOARD_CSS = """\
+:root {
+  --ink:#0b1f3b; --slate:#5b6b7a; --teal:#1f7a8c; --sand:#f6f4f0; --line:#d7dee6;
+  --accent:#c9a227;
+}
+body { margin:0; font-family:"Source Sans 3","Segoe UI",Arial,sans-serif; background:var(--sand); color:var(--ink); }
+.wrap { max-width:1200px; margin:0 auto; padding:32px 24px 60px; }
+header { background:linear-gradient(120deg,#0b1f3b 0%,#12345a 45%,#1f7a8c 100%); color:#fff; padding:24px 28px; border-radius:16px; }
+header h1 { margin:0 0 6px; font-size:24px; }
+header .meta { color:rgba(255,255,255,0.75); }
+.controls { margin-top:14px; }
+select { padding:8px 10px; border-radius:8px; border:1px solid var(--line); }
+.grid { display:grid; grid-template-columns:repeat(auto-fit,minmax(260px,1fr)); gap:16px; margin-top:20px; }
+.card { background:#fff; border-radius:14px; padding:16px; border:1px solid var(--line); box-shadow:0 8px 16px rgba(11,31,59,0.05); }
+.card h2 { margin-top:0; font-size:16px; color:var(--teal); }
+table { width:100%; border-collapse:collapse; font-size:13px; }
+th, td { text-align:left; padding:8px 10px; border-bottom:1px solid var(--line); }
+th { background:#f2f5f8; }
+details.collapsible { background:#fff; border:1px solid var(--line); border-radius:12px; padding:8px 12px; box-shadow:0 8px 16px rgba(11,31,59,0.05); }
+details.collapsible summary { cursor:pointer; font-weight:600; color:var(--teal); margin:4px 0 8px; }
+details.collapsible[open] summary { margin-bottom:12px; }
+.section { margin-top:24px; }
+.section h2 { margin-bottom:10px; font-size:18px; }
+"""
 
+_RUN_PAGE_HEAD_TAIL = """\
+  <link rel="stylesheet" href="dashboard.css" />
+</head>
+<body>
+  <div class="wrap">
+"""
 
-def _fetch_attempt_errors(run_id: str, limit: int = 25) -> list[tuple[Any, ...]]:
-    sql = """
-        SELECT
-            a.kind,
-            a.method,
-            a.status,
-            a.error,
-            c.url,
-            c.source_id,
-            a.started_at
-        FROM attempts a
-        JOIN candidates c ON c.candidate_id = a.candidate_id
-        WHERE c.metadata->>'run_id' = %s
-          AND (a.status = 'ERROR' OR a.error IS NOT NULL)
-        ORDER BY a.started_at DESC
-        LIMIT %s
-    """
-    with psycopg.connect(_dsn_from_env()) as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, (run_id, limit))
-            return cur.fetchall()
+_RUN_PAGE_FOOTER = """\
+  </div>
+</body>
+</html>
+"""
 
 
-def _render_run_page(run: dict[str, Any], runs: list[dict[str, Any]], config) -> str:
-    counts = _run_counts(run, config)
-    rejections = _fetch_rejections(run["run_id"])
+def _write_run_page(
+    fh: TextIO,
+    run: dict[str, Any],
+    data: dict[str, Any],
+    rejections: dict[str, int] | None,
+) -> None:
+    counts = data["counts"]
     started_at = run["started_at"]
     ended_at = run["ended_at"] or datetime.now(timezone.utc)
-    render_stats = _fetch_render_stats(run["run_id"], started_at, ended_at)
-    costs = _fetch_costs(run["run_date"])
-    phase_rows = _fetch_phase_timings(run["run_id"])
-    attempt_errors = _fetch_attempt_errors(run["run_id"])
+    render_stats = data["render_stats"]
+    costs = data["costs"]
+    phase_rows = data["phase_rows"]
+    attempt_errors = data["attempt_errors"]
 
     metrics = run.get("metrics") or {}
     llm_counts = counts["llm_counts"]
     good_selected = llm_counts.get("summarise", 0)
 
-    rejection_rows = ""
     if rejections is None:
         rejection_rows = "<tr><td colspan='2'>Rejection stats not available (Mongo not configured).</td></tr>"
     else:
-        for stage, count in sorted(rejections.items()):
-            rejection_rows += f"<tr><td>{stage}</td><td>{count}</td></tr>"
+        rejection_rows = "".join(
+            f"<tr><td>{stage}</td><td>{count}</td></tr>" for stage, count in sorted(rejections.items())
+        )
 
-    render_rows = ""
-    for stage, model, calls, avg_latency, tokens_prompt, tokens_completion in render_stats["rows"]:
-        render_rows += (
+    render_rows = "".join(
+        "<tr>"
+        f"<td>{stage}</td>"
+        f"<td>{model}</td>"
+        f"<td>{calls}</td>"
+        f"<td>{int(avg_latency or 0)}</td>"
+        f"<td>{int(tokens_prompt or 0)}</td>"
+        f"<td>{int(tokens_completion or 0)}</td>"
+        "</tr>"
+        for stage, model, calls, avg_latency, tokens_prompt, tokens_completion in render_stats["rows"]
+    )
+
+    error_rows = "".join(
+        "<tr>"
+        f"<td>{_escape(kind)}</td>"
+        f"<td>{_escape(method)}</td>"
+        f"<td>{_escape(status)}</td>"
+        f"<td>{_escape(error or '')}</td>"
+        f"<td>{_escape(url or '')}</td>"
+        f"<td>{_escape(source_id)}</td>"
+        f"<td>{_format_dt(started_at_err) if started_at_err else ''}</td>"
+        "</tr>"
+        for kind, method, status, error, url, source_id, started_at_err in attempt_errors
+    )
+
+    if costs:
+        cost_rows = "".join(
             "<tr>"
+            f"<td>{usage_date}</td>"
             f"<td>{stage}</td>"
+            f"<td>{provider}</td>"
             f"<td>{model}</td>"
+            f"<td>{service_tier or ''}</td>"
             f"<td>{calls}</td>"
-            f"<td>{int(avg_latency or 0)}</td>"
-            f"<td>{int(tokens_prompt or 0)}</td>"
-            f"<td>{int(tokens_completion or 0)}</td>"
+            f"<td>${float(total):.4f}</td>"
             "</tr>"
+            for usage_date, stage, provider, model, service_tier, calls, total in costs
         )
-
-    error_rows = ""
-    for kind, method, status, error, url, source_id, started_at_err in attempt_errors:
-        error_rows += (
-            "<tr>"
-            f"<td>{html.escape(str(kind))}</td>"
-            f"<td>{html.escape(str(method))}</td>"
-            f"<td>{html.escape(str(status))}</td>"
-            f"<td>{html.escape(str(error or ''))}</td>"
-            f"<td>{html.escape(str(url or ''))}</td>"
-            f"<td>{html.escape(str(source_id))}</td>"
-            f"<td>{_format_dt(started_at_err) if started_at_err else ''}</td>"
-            "</tr>"
-        )
-
-    cost_rows = ""
-    if costs:
-        for usage_date, stage, provider, model, service_tier, calls, total in costs:
-            cost_rows += (
-                "<tr>"
-                f"<td>{usage_date}</td>"
-                f"<td>{stage}</td>"
-                f"<td>{provider}</td>"
-                f"<td>{model}</td>"
-                f"<td>{service_tier or ''}</td>"
-                f"<td>{calls}</td>"
-                f"<td>${float(total):.4f}</td>"
-                "</tr>"
-            )
     else:
         cost_rows = "<tr><td colspan='7'>No cost data for this run date.</td></tr>"
 
-    phase_table_rows = ""
     if phase_rows:
-        for phase, p_start, p_end, duration_ms in phase_rows:
-            phase_table_rows += (
-                "<tr>"
-                f"<td>{phase}</td>"
-                f"<td>{_format_dt(p_start) if p_start else ''}</td>"
-                f"<td>{_format_dt(p_end) if p_end else ''}</td>"
-                f"<td>{_format_duration_ms(duration_ms)}</td>"
-                "</tr>"
-            )
+        phase_table_rows = "".join(
+            "<tr>"
+            f"<td>{phase}</td>"
+            f"<td>{_format_dt(p_start) if p_start else ''}</td>"
+            f"<td>{_format_dt(p_end) if p_end else ''}</td>"
+            f"<td>{_format_duration_ms(duration_ms)}</td>"
+            "</tr>"
+            for phase, p_start, p_end, duration_ms in phase_rows
+        )
     else:
         phase_table_rows = "<tr><td colspan='4'>No phase timing data found.</td></tr>"
 
-    run_list = "".join(
-        f"<option value='run_{r['run_id']}.html'>{r['run_date']} · {r['started_at'].strftime('%H:%M:%S')}</option>"
-        for r in runs
-    )
-
     duration = ended_at - started_at
     duration_str = _format_duration(duration)
     started_str = _format_dt(started_at)
     ended_str = _format_dt(ended_at)
 
-    return f"""<!DOCTYPE html>
+    fh.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
   <title>Digest Run Dashboard · {run['run_date']}</title>
-  <style>
-    :root {{
-      --ink:#0b1f3b; --slate:#5b6b7a; --teal:#1f7a8c; --sand:#f6f4f0; --line:#d7dee6;
-      --accent:#c9a227;
-    }}
-    body {{ margin:0; font-family:"Source Sans 3","Segoe UI",Arial,sans-serif; background:var(--sand); color:var(--ink); }}
-    .wrap {{ max-width:1200px; margin:0 auto; padding:32px 24px 60px; }}
-    header {{ background:linear-gradient(120deg,#0b1f3b 0%,#12345a 45%,#1f7a8c 100%); color:#fff; padding:24px 28px; border-radius:16px; }}
-    header h1 {{ margin:0 0 6px; font-size:24px; }}
-    header .meta {{ color:rgba(255,255,255,0.75); }}
-    .controls {{ margin-top:14px; }}
-    select {{ padding:8px 10px; border-radius:8px; border:1px solid var(--line); }}
-    .grid {{ display:grid; grid-template-columns:repeat(auto-fit,minmax(260px,1fr)); gap:16px; margin-top:20px; }}
-    .card {{ background:#fff; border-radius:14px; padding:16px; border:1px solid var(--line); box-shadow:0 8px 16px rgba(11,31,59,0.05); }}
-    .card h2 {{ margin-top:0; font-size:16px; color:var(--teal); }}
-    table {{ width:100%; border-collapse:collapse; font-size:13px; }}
-    th, td {{ text-align:left; padding:8px 10px; border-bottom:1px solid var(--line); }}
-    th {{ background:#f2f5f8; }}
-    details.collapsible {{ background:#fff; border:1px solid var(--line); border-radius:12px; padding:8px 12px; box-shadow:0 8px 16px rgba(11,31,59,0.05); }}
-    details.collapsible summary {{ cursor:pointer; font-weight:600; color:var(--teal); margin:4px 0 8px; }}
-    details.collapsible[open] summary {{ margin-bottom:12px; }}
-    .section {{ margin-top:24px; }}
-    .section h2 {{ margin-bottom:10px; font-size:18px; }}
-  </style>
-</head>
-<body>
-  <div class="wrap">
-    <header>
+""")
+    fh.write(_RUN_PAGE_HEAD_TAIL)
+    fh.write(f"""    <header>
       <h1>Lloyd’s Market Digest · Run Dashboard</h1>
       <div class="meta">Run date: {run['run_date']} · Started: {started_str} · Ended: {ended_str} · Duration: {duration_str}</div>
       <div class="controls">
         <label for="runSelect">Other runs:</label>
-        <select id="runSelect" onchange="if(this.value) window.location.href=this.value;">
-          {run_list}
-        </select>
+        <select id="runSelect" onchange="if(this.value) window.location.href=this.value;"></select>
+        <script src="runs.js"></script>
       </div>
     </header>
 
@@ -439,27 +574,34 @@ def _render_run_page(run: dict[str, Any], runs: list[dict[str, Any]], config) ->
         </table>
       </details>
     </div>
-  </div>
-</body>
-</html>
+""")
+    fh.write(_RUN_PAGE_FOOTER)
+
+
+def _render_runs_script(runs: list[dict[str, Any]]) -> str:
+    options = [
+        [f"run_{r['run_id']}.html", f"{r['run_date']} · {_format_time(r['started_at'])}"]
+        for r in runs
+    ]
+    return f"""(function () {{
+  var select = document.getElementById("runSelect");
+  {json.dumps(options, ensure_ascii=False)}.forEach(function (opt) {{
+    select.add(new Option(opt[1], opt[0]));
+  }});
+}})();
 """
 
 
 def _render_index_page(runs: list[dict[str, Any]]) -> str:
-    rows = ""
-    for run in runs:
-        run_id = run["run_id"]
-        run_date = run["run_date"]
-        started = run["started_at"]
-        ended = run["ended_at"] or "-"
-        rows += (
-            "<tr>"
-            f"<td>{run_date}</td>"
-            f"<td>{started}</td>"
-            f"<td>{ended}</td>"
-            f"<td><a href='run_{run_id}.html'>View</a></td>"
-            "</tr>"
-        )
+    rows = "".join(
+        "<tr>"
+        f"<td>{run['run_date']}</td>"
+        f"<td>{run['started_at']}</td>"
+        f"<td>{run['ended_at'] or '-'}</td>"
+        f"<td><a href='run_{run['run_id']}.html'>View</a></td>"
+        "</tr>"
+        for run in runs
+    )
 
     return f"""<!DOCTYPE html>
 <html lang="en">
@@ -489,8 +631,18 @@ def _render_index_page(runs: list[dict[str, Any]]) -> str:
 """
 
 
+def _escape(value: object) -> str:
+    text = value if isinstance(value, str) else str(value)
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+
 def _format_dt(value: datetime) -> str:
-    return value.strftime("%Y-%b-%d %H:%M:%S")
+    # Equivalent to strftime("%Y-%b-%d %H:%M:%S") in the C locale, without the strftime call.
+    return f"{value.year}-{_MONTH_ABBRS[value.month - 1]}-{value.day:02d} {_format_time(value)}"
+
+
+def _format_time(value: datetime) -> str:
+    return f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
 
 
 def _format_duration(delta: timedelta) -> str:
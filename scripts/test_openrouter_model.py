@@ -55,8 +55,8 @@ body = {
 started = datetime.now(timezone.utc)
 print(f"start={started.isoformat()} model={MODEL} timeout={TIMEOUT} max_tokens={MAX_TOKENS}")
 
-with httpx.Client(timeout=TIMEOUT) as client:
-    resp = client.post("https://openrouter.ai/api/v1/chat/completions", headers=headers, json=body)
+with httpx.Client(timeout=TIMEOUT, headers=headers) as client:
+    resp = client.post("https://openrouter.ai/api/v1/chat/completions", json=body)
     print(f"status={resp.status_code}")
     if resp.status_code >= 400:
         print(resp.text)
@@ -2,7 +2,7 @@ import json
 import os
 from pathlib import Path
 
-import requests
+import httpx
 
 try:
     from lloyds_digest.utils import load_env_file
@@ -31,40 +31,38 @@ first_payload = {
     "reasoning": {"enabled": True},
 }
 
-response = requests.post(
-    "https://openrouter.ai/api/v1/chat/completions",
-    headers=headers,
-    data=json.dumps(first_payload),
-    timeout=120,
-)
-response.raise_for_status()
-first_data = response.json()
-assistant_message = first_data["choices"][0]["message"]
+# Both turns share one client so the second request reuses the connection.
+with httpx.Client(timeout=120, headers=headers) as client:
+    response = client.post(
+        "https://openrouter.ai/api/v1/chat/completions",
+        json=first_payload,
+    )
+    response.raise_for_status()
+    first_data = response.json()
+    assistant_message = first_data["choices"][0]["message"]
 
-messages = [
-    {"role": "user", "content": "How many r's are in the word 'strawberry'?"},
-    {
-        "role": "assistant",
-        "content": assistant_message.get("content"),
-        "reasoning_details": assistant_message.get("reasoning_details"),
-    },
-    {"role": "user", "content": "Are you sure? Think carefully."},
-]
+    messages = [
+        {"role": "user", "content": "How many r's are in the word 'strawberry'?"},
+        {
+            "role": "assistant",
+            "content": assistant_message.get("content"),
+            "reasoning_details": assistant_message.get("reasoning_details"),
+        },
+        {"role": "user", "content": "Are you sure? Think carefully."},
+    ]
 
-second_payload = {
-    "model": model,
-    "messages": messages,
-    "reasoning": {"enabled": True},
-}
+    second_payload = {
+        "model": model,
+        "messages": messages,
+        "reasoning": {"enabled": True},
+    }
 
-response2 = requests.post(
-    "https://openrouter.ai/api/v1/chat/completions",
-    headers=headers,
-    data=json.dumps(second_payload),
-    timeout=120,
-)
-response2.raise_for_status()
-second_data = response2.json()
+    response2 = client.post(
+        "https://openrouter.ai/api/v1/chat/completions",
+        json=second_payload,
+    )
+    response2.raise_for_status()
+    second_data = response2.json()
 
 print("first_response:")
 print(json.dumps(first_data, indent=2))
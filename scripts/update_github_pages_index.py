@@ -3,61 +3,107 @@ from __future__ import annotations
 
 import argparse
 import calendar
+import heapq
 import html
+import json
+import os
 import re
+import time
 from collections import OrderedDict
 from datetime import date
+from itertools import groupby
 from pathlib import Path
 
-
-def _digest_files(digests_dir: Path) -> list[Path]:
-    return sorted(digests_dir.glob("digest_*.html"), reverse=True)
+_NAV_RE = re.compile(rb'(<a class="nav-btn (nav-home|nav-latest)" href=")([^"]*)(">)')
+_PLACEHOLDER_RE = re.compile(r"REPLACE_(LATEST|ARCHIVE)")
+_DIGEST_NAME_RE = re.compile(r"digest_(\d{4})-(\d{2})-(\d{2})\.html$")
 
 
-def _refresh_digest_nav_links(files: list[Path], latest: str) -> None:
+def _digest_files(digests_dir: Path) -> list[Path]:
+    # Unordered: callers that need the newest digests pick them with a partial sort.
+    try:
+        with os.scandir(digests_dir) as entries:
+            return [
+                digests_dir / entry.name
+                for entry in entries
+                if entry.name.startswith("digest_")
+                and entry.name.endswith(".html")
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _read_watermark(watermark_path: Path) -> tuple[str, float] | None:
+    try:
+        data = json.loads(watermark_path.read_text(encoding="utf-8"))
+        return str(data["latest"]), float(data["updated_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _rewrite_one(digest_path: Path, targets: dict[bytes, bytes], since: float | None) -> None:
+    if since is not None and digest_path.stat().st_mtime < since:
+        return
+    digest_html = digest_path.read_bytes()
+    if b"nav-btn" not in digest_html:
+        return
+    # Most archived digests already point at the right targets; check before rewriting.
+    if all(m[3] == targets[m[2]] for m in _NAV_RE.finditer(digest_html)):
+        return
+    updated = _NAV_RE.sub(lambda m: m[1] + targets[m[2]] + m[4], digest_html)
+    digest_path.write_bytes(updated)
+
+
+def _refresh_digest_nav_links(
+    files: list[Path], latest: str, watermark_path: Path | None = None
+) -> None:
+    # Files untouched since the last refresh already point at the same latest digest.
+    watermark = _read_watermark(watermark_path) if watermark_path else None
+    since = watermark[1] if watermark and watermark[0] == latest else None
+    targets = {b"nav-home": b"../index.html", b"nav-latest": latest.encode("utf-8")}
     for digest_path in files:
-        html = digest_path.read_text(encoding="utf-8")
-        original = html
-        html = re.sub(
-            r'(<a class="nav-btn nav-home" href=")[^"]*(">)',
-            r"\1../index.html\2",
-            html,
+        _rewrite_one(digest_path, targets, since)
+    if watermark_path:
+        watermark_path.write_text(
+            json.dumps({"latest": latest, "updated_at": time.time()}), encoding="utf-8"
         )
-        html = re.sub(
-            r'(<a class="nav-btn nav-latest" href=")[^"]*(">)',
-            rf"\1{latest}\2",
-            html,
-        )
-        if html != original:
-            digest_path.write_text(html, encoding="utf-8")
+
+
+def _month_key(parsed: tuple[int, int, Path]) -> tuple[int, int]:
+    return parsed[0], parsed[1]
+
+
+def _archive_item(path: Path, indent: str) -> str:
+    name = html.escape(path.name)
+    return f'{indent}<li><a href="digests/{name}">{name}</a></li>'
 
 
 def _archive_html(files: list[Path]) -> str:
     if not files:
         return ""
 
-    grouped: "OrderedDict[tuple[int, int], list[Path]]" = OrderedDict()
-    for f in files:
-        match = re.match(r"digest_(\d{4})-(\d{2})-(\d{2})\.html$", f.name)
-        if not match:
-            continue
-        year = int(match.group(1))
-        month = int(match.group(2))
-        key = (year, month)
-        grouped.setdefault(key, []).append(f)
+    parsed = [
+        (int(match[1]), int(match[2]), f)
+        for f in files
+        if (match := _DIGEST_NAME_RE.match(f.name))
+    ]
+    # Stable sort: newest month first, files keep their order within a month.
+    parsed.sort(key=_month_key, reverse=True)
+    grouped: "OrderedDict[tuple[int, int], list[Path]]" = OrderedDict(
+        (key, [f for _, _, f in group]) for key, group in groupby(parsed, key=_month_key)
+    )
 
     if not grouped:
-        return "\n".join(
-            f'        <li><a href="digests/{html.escape(f.name)}">{html.escape(f.name)}</a></li>'
-            for f in files
-        )
+        return "\n".join(_archive_item(f, "        ") for f in files)
 
     today_key = (date.today().year, date.today().month)
     open_key = today_key if today_key in grouped else next(iter(grouped.keys()))
 
-    year_groups: "OrderedDict[int, list[tuple[int, list[Path]]]]" = OrderedDict()
-    for (year, month), month_files in grouped.items():
-        year_groups.setdefault(year, []).append((month, month_files))
+    year_groups: "OrderedDict[int, list[tuple[int, list[Path]]]]" = OrderedDict(
+        (year, [(month, month_files) for (_, month), month_files in months])
+        for year, months in groupby(grouped.items(), key=lambda item: item[0][0])
+    )
 
     year_chunks: list[str] = []
     for year, months in year_groups.items():
@@ -67,10 +113,7 @@ def _archive_html(files: list[Path]) -> str:
             month_open = " open" if key == open_key else ""
             current_class = " current" if key == today_key else ""
             month_name = calendar.month_name[month]
-            links = "\n".join(
-                f'                <li><a href="digests/{html.escape(f.name)}">{html.escape(f.name)}</a></li>'
-                for f in month_files
-            )
+            links = "\n".join(_archive_item(f, "                ") for f in month_files)
             month_chunks.append(
                 f"""          <details class="month-group{current_class}"{month_open}>
             <summary>{month_name} {year} <span>{len(month_files)} editions</span></summary>
@@ -100,9 +143,10 @@ def update_index(site_dir: Path, archive_limit: int, allow_index_fallback: bool)
     if not files:
         raise SystemExit("No digests found in docs/digests/")
 
-    latest = files[0].name
-    archive = files[:archive_limit]
-    _refresh_digest_nav_links(files, latest)
+    newest = heapq.nlargest(max(archive_limit, 1), files, key=lambda path: path.name)
+    latest = newest[0].name
+    archive = newest[:archive_limit]
+    _refresh_digest_nav_links(files, latest, site_dir / ".index_watermark")
 
     if template_path.exists():
         template = template_path.read_text(encoding="utf-8")
@@ -111,9 +155,13 @@ def update_index(site_dir: Path, archive_limit: int, allow_index_fallback: bool)
     else:
         raise SystemExit(f"Missing template at {template_path}")
 
-    template = template.replace("REPLACE_LATEST", latest)
-    template = template.replace("REPLACE_ARCHIVE", _archive_html(archive))
-    index_path.write_text(template, encoding="utf-8")
+    values = {"LATEST": latest, "ARCHIVE": _archive_html(archive)}
+    template = _PLACEHOLDER_RE.sub(lambda m: values[m[1]], template)
+    # Write beside the target and swap it in, so the index is never half-written.
+    tmp_path = index_path.with_suffix(".html.tmp")
+    with open(tmp_path, "w", encoding="utf-8", buffering=64 * 1024) as fh:
+        fh.write(template)
+    os.replace(tmp_path, index_path)
     return index_path
 
 
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
+import importlib.util
 import json
 import os
+import threading
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -11,9 +16,13 @@ import httpx
 
 from lloyds_digest.storage.mongo_repo import MongoRepo
 
-
 PROMPTS_DIR = Path(__file__).parent / "prompts"
 
+_JSON_DECODER = json.JSONDecoder()
+_HASH_CHUNK_CHARS = 64 * 1024
+_HTTP_CLIENT: httpx.Client | None = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
 
 @dataclass(frozen=True)
 class PromptSpec:
@@ -23,7 +32,51 @@ class PromptSpec:
 
     @property
     def prompt_text(self) -> str:
-        return (PROMPTS_DIR / self.filename).read_text(encoding="utf-8")
+        return _read_prompt(self.filename)
+
+
+@cache
+def _read_prompt(filename: str) -> str:
+    # Prompt files ship with the package and do not change while the process runs.
+    return (PROMPTS_DIR / filename).read_text(encoding="utf-8")
+
+
+@dataclass(frozen=True)
+class _ClientSettings:
+    ollama_host: str
+    ollama_timeout: float
+    openai_base_url: str
+    openai_api_key: str
+    openai_service_tier: str
+    openai_fallback_service_tier: str
+    openai_max_completion_tokens: int | None
+    openai_timeout: float
+
+    @classmethod
+    def from_env(cls) -> _ClientSettings:
+        max_completion_tokens = os.environ.get("OPENAI_MAX_COMPLETION_TOKENS", "").strip()
+        return cls(
+            ollama_host=os.environ.get("OLLAMA_HOST", "http://localhost:11434"),
+            ollama_timeout=float(os.environ.get("OLLAMA_TIMEOUT", "120")),
+            openai_base_url=os.environ.get("OPENAI_BASE_URL", "https://api.openai.com"),
+            openai_api_key=os.environ.get("OPENAI_API_KEY", ""),
+            openai_service_tier=os.environ.get("OPENAI_SERVICE_TIER", "flex"),
+            openai_fallback_service_tier=os.environ.get("OPENAI_FALLBACK_SERVICE_TIER", "standard"),
+            openai_max_completion_tokens=(
+                int(max_completion_tokens) if max_completion_tokens else None
+            ),
+            openai_timeout=float(os.environ.get("OPENAI_TIMEOUT", "120")),
+        )
+
+
+@cache
+def _client_settings() -> _ClientSettings:
+    # The CLI loads .env before the first AI call; the env is not changed after that.
+    return _ClientSettings.from_env()
+
+
+def _reset_env_cache() -> None:
+    _client_settings.cache_clear()
 
 
 @dataclass
@@ -32,7 +85,7 @@ class OllamaClient:
     host: str | None = None
 
     def _endpoint(self) -> str:
-        base = self.host or os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+        base = self.host or _client_settings().ollama_host
         return f"{base.rstrip('/')}/api/generate"
 
     def generate(self, prompt: str) -> dict[str, Any]:
@@ -41,11 +94,10 @@ class OllamaClient:
             "prompt": prompt,
             "stream": False,
         }
-        timeout = float(os.environ.get("OLLAMA_TIMEOUT", "120"))
-        with httpx.Client(timeout=timeout) as client:
-            response = client.post(self._endpoint(), json=payload)
-            response.raise_for_status()
-            return response.json()
+        timeout = _client_settings().ollama_timeout
+        response = _http_client().post(self._endpoint(), json=payload, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
 
 
 @dataclass
@@ -56,21 +108,21 @@ class OpenAIClient:
     service_tier: str | None = None
 
     def _endpoint(self) -> str:
-        base = self.base_url or os.environ.get("OPENAI_BASE_URL", "https://api.openai.com")
+        base = self.base_url or _client_settings().openai_base_url
         return f"{base.rstrip('/')}/v1/chat/completions"
 
     def _resolve_api_key(self) -> str:
-        key = self.api_key or os.environ.get("OPENAI_API_KEY", "")
+        key = self.api_key or _client_settings().openai_api_key
         if not key:
             raise ValueError("OPENAI_API_KEY is required when LLM mode is enabled.")
         return key
 
     def generate(self, prompt: str) -> dict[str, Any]:
-        primary_tier = self.service_tier or os.environ.get("OPENAI_SERVICE_TIER", "flex")
+        primary_tier = self.service_tier or _client_settings().openai_service_tier
         result = self._generate_with_tier(prompt, primary_tier)
         if result is not None:
             return result
-        fallback_tier = os.environ.get("OPENAI_FALLBACK_SERVICE_TIER", "standard")
+        fallback_tier = _client_settings().openai_fallback_service_tier
         return self._generate_with_tier(prompt, fallback_tier)
 
     def _generate_with_tier(self, prompt: str, service_tier: str | None) -> dict[str, Any] | None:
@@ -85,29 +137,32 @@ class OpenAIClient:
         if not self.model.startswith("gpt-5"):
             payload["temperature"] = 0.2
 
-        tier = (service_tier or os.environ.get("OPENAI_SERVICE_TIER", "flex")).strip()
+        tier = (service_tier or _client_settings().openai_service_tier).strip()
         payload["service_tier"] = tier or "flex"
 
-        max_completion_tokens = os.environ.get("OPENAI_MAX_COMPLETION_TOKENS", "").strip()
-        if max_completion_tokens:
-            payload["max_completion_tokens"] = int(max_completion_tokens)
+        settings = _client_settings()
+        if settings.openai_max_completion_tokens is not None:
+            payload["max_completion_tokens"] = settings.openai_max_completion_tokens
 
-        timeout = float(os.environ.get("OPENAI_TIMEOUT", "120"))
+        timeout = settings.openai_timeout
         headers = {
             "Authorization": f"Bearer {self._resolve_api_key()}",
             "Content-Type": "application/json",
         }
-        with httpx.Client(timeout=timeout) as client:
-            response = client.post(self._endpoint(), json=payload, headers=headers)
-            if response.status_code >= 400:
-                if self._should_fallback(response, payload["service_tier"]):
-                    return None  # caller will retry using the fallback tier
-                response.raise_for_status()
-            data = response.json()
+        response = _http_client().post(
+            self._endpoint(), json=payload, headers=headers, timeout=timeout
+        )
+        if response.status_code >= 400:
+            if self._should_fallback(response, payload["service_tier"]):
+                return None  # caller will retry using the fallback tier
+            response.raise_for_status()
+        data = response.json()
+        text, prompt_tokens, completion_tokens, cached_prompt_tokens = _parse_openai_response(data)
         return {
-            "response": _extract_openai_text(data),
+            "response": text,
             "raw": data,
             "service_tier": payload["service_tier"],
+            "usage": (prompt_tokens, completion_tokens, cached_prompt_tokens),
         }
 
     def _should_fallback(self, response: httpx.Response, service_tier: str) -> bool:
@@ -118,20 +173,22 @@ class OpenAIClient:
             return False
         if service_tier.lower() != "flex":
             return False
-        fallback_tier = os.environ.get("OPENAI_FALLBACK_SERVICE_TIER", "standard").strip() or "standard"
+        fallback_tier = _client_settings().openai_fallback_service_tier.strip() or "standard"
         return fallback_tier.lower() != "flex"
 
 
 def build_cache_key(model: str, prompt_version: str, content: str) -> str:
-    payload = json.dumps(
-        {
-            "model": model,
-            "prompt_version": prompt_version,
-            "content": normalize_cache_content(content),
-        },
-        sort_keys=True,
-    )
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    # Hash the fields directly, split by a unit separator, rather than JSON-escaping
+    # a full copy of the article body first.
+    digest = hashlib.sha256(model.encode("utf-8"))
+    digest.update(b"\x1f")
+    digest.update(prompt_version.encode("utf-8"))
+    digest.update(b"\x1f")
+    normalized = normalize_cache_content(content)
+    # Encode long bodies in slices so no second full-size bytes copy is built just to hash.
+    for start in range(0, len(normalized), _HASH_CHUNK_CHARS):
+        digest.update(normalized[start : start + _HASH_CHUNK_CHARS].encode("utf-8"))
+    return digest.hexdigest()
 
 
 def normalize_cache_content(content: str) -> str:
@@ -151,7 +208,13 @@ def post_openai_chat_completion(
     system_prompt: str,
     temperature: float | None = None,
     max_attempts: int = 1,
+    on_delta: Callable[[str], None] | None = None,
 ) -> dict[str, Any]:
+    """POST a chat completion; with on_delta the reply is streamed and each text delta passed to it.
+
+    Streamed replies are reassembled into the same {"choices": [...], "usage": {...}}
+    shape as a regular response.
+    """
     url = "https://api.openai.com/v1/chat/completions"
     headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
     body: dict[str, Any] = {
@@ -164,36 +227,107 @@ def post_openai_chat_completion(
     }
     if temperature is not None:
         body["temperature"] = temperature
+    if on_delta is not None:
+        body["stream"] = True
+        body["stream_options"] = {"include_usage": True}
+    # Serialise once; the payload only changes if we drop from flex to the fallback tier.
+    content = _encode_json(body)
+    client = _http_client()
     for attempt in range(1, max_attempts + 1):
-        with httpx.Client(timeout=timeout) as client:
-            response = client.post(url, headers=headers, json=body)
-            actual_tier = body["service_tier"]
-            if (
-                response.status_code == 429
-                and actual_tier.lower() == "flex"
-                and fallback_tier.lower() != "flex"
-                and _is_flex_capacity_429(response)
-            ):
-                print(f"OpenAI flex exhausted; retrying on tier={fallback_tier}", flush=True)
-                body["service_tier"] = fallback_tier
-                actual_tier = fallback_tier
-                response = client.post(url, headers=headers, json=body)
-            if response.status_code >= 400:
-                if attempt == max_attempts:
-                    raise httpx.HTTPStatusError(
-                        f"OpenAI error {response.status_code}: {response.text}",
-                        request=response.request,
-                        response=response,
-                    )
-                continue
+        response, data = _send_chat_completion(client, url, headers, content, timeout, on_delta)
+        actual_tier = body["service_tier"]
+        if (
+            response.status_code == 429
+            and actual_tier.lower() == "flex"
+            and fallback_tier.lower() != "flex"
+            and _is_flex_capacity_429(response)
+        ):
+            print(f"OpenAI flex exhausted; retrying on tier={fallback_tier}", flush=True)
+            body["service_tier"] = fallback_tier
+            actual_tier = fallback_tier
+            content = _encode_json(body)
+            response, data = _send_chat_completion(client, url, headers, content, timeout, on_delta)
+        if response.status_code >= 400:
+            if attempt == max_attempts or not _is_retryable_status(response.status_code):
+                raise httpx.HTTPStatusError(
+                    f"OpenAI error {response.status_code}: {response.text}",
+                    request=response.request,
+                    response=response,
+                )
+            continue
+        if data is None:
             data = response.json()
-            return {
-                "data": data,
-                "service_tier": actual_tier,
-            }
+        return {
+            "data": data,
+            "service_tier": actual_tier,
+        }
     raise RuntimeError("OpenAI request failed after retries.")
 
 
+def _send_chat_completion(
+    client: httpx.Client,
+    url: str,
+    headers: dict[str, str],
+    content: bytes,
+    timeout: float,
+    on_delta: Callable[[str], None] | None,
+) -> tuple[httpx.Response, dict[str, Any] | None]:
+    if on_delta is None:
+        return client.post(url, headers=headers, content=content, timeout=timeout), None
+    with client.stream("POST", url, headers=headers, content=content, timeout=timeout) as response:
+        if response.status_code >= 400:
+            # Error bodies are small and needed for the flex-capacity check.
+            response.read()
+            return response, None
+        parts: list[str] = []
+        usage: dict[str, Any] = {}
+        for line in response.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            payload = line[5:].strip()
+            if payload == "[DONE]":
+                break
+            chunk = json.loads(payload)
+            usage = chunk.get("usage") or usage
+            for choice in chunk.get("choices") or []:
+                delta = (choice.get("delta") or {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    on_delta(delta)
+    return response, {"choices": [{"message": {"content": "".join(parts)}}], "usage": usage}
+
+
+def is_retryable_openai_error(exc: Exception) -> bool:
+    """Return False for client errors (bad key, malformed request) that a retry cannot fix."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return _is_retryable_status(exc.response.status_code)
+    return True
+
+
+def _is_retryable_status(status_code: int) -> bool:
+    # Timeouts, conflicts and rate limits can succeed on retry; other 4xx cannot.
+    return status_code >= 500 or status_code in (408, 409, 429)
+
+
+def _http_client() -> httpx.Client:
+    # One pooled client per process so retries and repeat calls reuse the
+    # TLS connection. Timeouts are passed per request.
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        with _HTTP_CLIENT_LOCK:
+            if _HTTP_CLIENT is None:
+                _HTTP_CLIENT = httpx.Client(
+                    http2=importlib.util.find_spec("h2") is not None,
+                    limits=httpx.Limits(max_keepalive_connections=4),
+                )
+                atexit.register(_HTTP_CLIENT.close)
+    return _HTTP_CLIENT
+
+
+def _encode_json(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def _is_flex_capacity_429(response: httpx.Response) -> bool:
     body_text = response.text.lower()
     return "resource_unavailable" in body_text or "insufficient resources" in body_text
@@ -203,9 +337,11 @@ def cached_call(
     mongo: MongoRepo | None,
     key: str,
     call_fn,
+    prefetched: Mapping[str, dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
     if mongo is not None:
-        cached = mongo.get_ai_cache(key)
+        # A prefetched map is authoritative for its keys, so a miss there skips the lookup too.
+        cached = prefetched.get(key) if prefetched is not None else mongo.get_ai_cache(key)
         if cached:
             return {"cached": True, "payload": cached}
     result = call_fn()
@@ -214,6 +350,33 @@ def cached_call(
     return {"cached": False, "payload": result}
 
 
+def prefetch_ai_cache(mongo: MongoRepo | None, keys: list[str]) -> dict[str, dict[str, Any]] | None:
+    """Fetch cache entries for several keys in one query; None if unavailable."""
+    if mongo is None:
+        return None
+    try:
+        return mongo.get_ai_cache_many(keys)
+    except Exception:
+        return None
+
+
+def safe_json(text: str) -> dict[str, Any]:
+    """Parse a model reply as a JSON object, returning {} for anything else."""
+    if not isinstance(text, str):
+        return {}
+    stripped = text.strip()
+    # Prose, markdown fences and empty replies are common; reject them without raising.
+    if not stripped or stripped[0] != "{":
+        return {}
+    try:
+        parsed, end = _JSON_DECODER.raw_decode(stripped)
+    except ValueError:
+        return {}
+    if end != len(stripped) or not isinstance(parsed, dict):
+        return {}
+    return parsed
+
+
 def estimate_tokens(text: str) -> int:
     if not text:
         return 0
@@ -229,6 +392,13 @@ def extract_openai_usage(raw: dict[str, Any]) -> tuple[int | None, int | None, i
     return prompt_tokens, completion_tokens, cached_prompt_tokens
 
 
+def _parse_openai_response(data: Any) -> tuple[str, int | None, int | None, int | None]:
+    """Return (text, prompt_tokens, completion_tokens, cached_prompt_tokens) from a reply."""
+    if not isinstance(data, dict):
+        return "", None, None, None
+    return (_extract_openai_text(data), *extract_openai_usage(data))
+
+
 def _extract_openai_text(payload: dict[str, Any]) -> str:
     choices = payload.get("choices")
     if not isinstance(choices, list) or not choices:
@@ -239,6 +409,10 @@ def _extract_openai_text(payload: dict[str, Any]) -> str:
     if isinstance(content, str):
         return content
     if isinstance(content, list):
+        if len(content) == 1:
+            item = content[0]
+            text = item.get("text") if isinstance(item, dict) else None
+            return text if isinstance(text, str) else ""
         parts: list[str] = []
         for item in content:
             if not isinstance(item, dict):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -80,9 +81,7 @@ def compute_cost_usd(
     return (input_cost, output_cost, total)
 
 
+@lru_cache(maxsize=64)
 def _normalise_model(model: str) -> str:
-    lowered = model.strip().lower()
-    for prefix in ("openai/", "chatgpt/"):
-        if lowered.startswith(prefix):
-            lowered = lowered[len(prefix) :]
-    return lowered
+    # Only a handful of distinct model strings appear in a run, so cache per input.
+    return model.strip().lower().removeprefix("openai/").removeprefix("chatgpt/")
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+from collections.abc import Mapping
 from typing import Any
 
 from lloyds_digest.ai.base import (
@@ -9,7 +9,7 @@ from lloyds_digest.ai.base import (
     build_cache_key,
     cached_call,
     estimate_tokens,
-    extract_openai_usage,
+    safe_json,
 )
 from lloyds_digest.storage.mongo_repo import MongoRepo
 
@@ -21,16 +21,18 @@ def relevance(
     model: str,
     mongo: MongoRepo | None = None,
     host: str | None = None,
+    prefetched: Mapping[str, dict[str, Any]] | None = None,
+    key: str | None = None,
 ) -> dict[str, Any]:
     prompt = f"{PROMPT.prompt_text}\n\nCONTENT:\n{text}"
-    key = build_cache_key(model, PROMPT.version, text)
+    if key is None:
+        key = build_cache_key(model, PROMPT.version, text)
 
     def _call() -> dict[str, Any]:
         client = OpenAIClient(model=model, base_url=host)
         response = client.generate(prompt)
         response_text = response.get("response", "")
-        raw = response.get("raw", {}) if isinstance(response.get("raw"), dict) else {}
-        prompt_tokens, completion_tokens, cached_prompt_tokens = extract_openai_usage(raw)
+        prompt_tokens, completion_tokens, cached_prompt_tokens = response["usage"]
         return {
             "response": response_text,
             "model": model,
@@ -42,9 +44,9 @@ def relevance(
             "tokens_cached_prompt": cached_prompt_tokens,
         }
 
-    result = cached_call(mongo, key, _call)
+    result = cached_call(mongo, key, _call, prefetched)
     raw = result["payload"].get("response", "")
-    parsed = _safe_json(raw)
+    parsed = safe_json(raw)
     payload = result["payload"]
     return {
         "cached": result["cached"],
@@ -52,11 +54,5 @@ def relevance(
         "parsed": parsed,
         "tokens_prompt": payload.get("tokens_prompt"),
         "tokens_completion": payload.get("tokens_completion"),
+        "tokens_cached_prompt": payload.get("tokens_cached_prompt"),
     }
-
-
-def _safe_json(text: str) -> dict[str, Any]:
-    try:
-        return json.loads(text)
-    except Exception:
-        return {}
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+USER_AGENT = "lloyds-digest/0.1"
+FETCH_WORKERS = 8
+
+_CLIENT: httpx.Client | None = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def shared_client() -> httpx.Client:
+    # One pooled client per process so feeds and listings on the same host reuse
+    # connections instead of paying a TCP+TLS handshake per source. Timeouts are
+    # passed per request.
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.Client(
+                    headers={"User-Agent": USER_AGENT},
+                    http2=importlib.util.find_spec("h2") is not None,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                )
+                atexit.register(_CLIENT.close)
+    return _CLIENT
+
+
+def fetch_all[T](
+    fetch: Callable[[str], T], urls: list[str], max_workers: int = FETCH_WORKERS
+) -> list[T | Exception]:
+    """Run ``fetch`` over ``urls`` concurrently, returning results in input order.
+
+    A failing URL yields its exception in place of a result so one bad source
+    does not abort the others.
+    """
+
+    def _guarded(url: str) -> T | Exception:
+        try:
+            return fetch(url)
+        except Exception as exc:
+            return exc
+
+    if len(urls) <= 1 or max_workers <= 1:
+        return [_guarded(url) for url in urls]
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(urls)), thread_name_prefix="discovery"
+    ) as executor:
+        return list(executor.map(_guarded, urls))
@@ -8,14 +8,20 @@ import re
 from typing import Callable, Iterable
 from urllib.parse import urljoin, urlsplit
 
-import httpx
-
 from lloyds_digest.discovery.csv_loader import CsvSourceRow
+from lloyds_digest.discovery.http_client import FETCH_WORKERS, fetch_all, shared_client
 from lloyds_digest.discovery.url_utils import candidate_id_from_url, canonicalise_url
 from lloyds_digest.models import Candidate
 from lloyds_digest.storage.mongo_repo import MongoRepo
 from lloyds_digest.storage.postgres_repo import PostgresRepo
 
+try:  # Optional fast path: libxml2 parses listing pages far quicker than html.parser.
+    from lxml import etree as _lxml_etree
+    from lxml import html as _lxml_html
+except ImportError:  # pragma: no cover - optional dependency
+    _lxml_etree = None
+    _lxml_html = None
+
 
 class _LinkExtractor(HTMLParser):
     def __init__(self) -> None:
@@ -24,15 +30,11 @@ class _LinkExtractor(HTMLParser):
         self._current_href: str | None = None
         self._text_parts: list[str] = []
 
+    # HTMLParser already lowercases tag and attribute names.
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        if tag.lower() != "a":
+        if tag != "a":
             return
-        href = None
-        for key, value in attrs:
-            if key.lower() == "href" and value:
-                href = value
-                break
-        self._current_href = href
+        self._current_href = next((value for key, value in attrs if key == "href" and value), None)
         self._text_parts = []
 
     def handle_data(self, data: str) -> None:
@@ -40,21 +42,36 @@ class _LinkExtractor(HTMLParser):
             self._text_parts.append(data)
 
     def handle_endtag(self, tag: str) -> None:
-        if tag.lower() != "a":
+        if tag != "a":
             return
         if self._current_href:
-            text = " ".join(part.strip() for part in self._text_parts).strip()
-            self.links.append((self._current_href, text))
+            self.links.append((self._current_href, _anchor_text(self._text_parts)))
         self._current_href = None
         self._text_parts = []
 
 
 def extract_links(html: str) -> list[tuple[str, str]]:
+    if _lxml_html is not None:
+        try:
+            root = _lxml_html.document_fromstring(html)
+        except (ValueError, _lxml_etree.LxmlError):
+            # Empty documents and str input with an XML encoding declaration.
+            pass
+        else:
+            return [
+                (href, _anchor_text(anchor.itertext()))
+                for anchor in root.iter("a")
+                if (href := anchor.get("href"))
+            ]
     parser = _LinkExtractor()
     parser.feed(html)
     return parser.links
 
 
+def _anchor_text(parts: Iterable[str]) -> str:
+    return " ".join(part.strip() for part in parts).strip()
+
+
 @dataclass
 class ListingDiscoverer:
     timeout: float = 20.0
@@ -72,90 +89,97 @@ class ListingDiscoverer:
         candidates: list[Candidate] = []
         dedup = seen if seen is not None else set()
 
-        for source in sources:
-            if source.page_type != "listing":
-                continue
-            try:
-                if log:
-                    log(f"[listing] Fetching listing {source.url}")
-                html = self._fetch_listing(source.url)
-                links = extract_links(html)
-                if log:
-                    log(f"[listing] Extracted {len(links)} links from {source.domain}")
-            except Exception as exc:
-                # A single listing source may be paywalled/blocked (401/403) or temporarily down.
-                # Don't fail the entire listing discovery pass; just skip this source.
-                if log:
-                    log(f"[listing] Listing failed {source.url}: {exc}")
-                continue
-            snapshot_id = None
-            if mongo is not None:
-                snapshot_id = mongo.insert_discovery_snapshot(
-                    {
-                        "source_id": source.to_source().source_id,
-                        "url": source.url,
-                        "fetched_at": _utc_now(),
-                        "link_count": len(links),
-                        "run_id": run_id,
-                    }
-                )
-
-            for href, text in links:
-                absolute = urljoin(source.url, href)
-                if not _is_http_url(absolute):
-                    continue
-                if not allow_external and not _same_domain(absolute, source.domain):
+        listing_sources = [source for source in sources if source.page_type == "listing"]
+        if log:
+            for source in listing_sources:
+                log(f"[listing] Fetching listing {source.url}")
+        # Fetch every listing up front so network round-trips overlap; results
+        # are then processed in source order, keeping dedup deterministic.
+        # Playwright launches a browser per page, so it stays sequential.
+        workers = 1 if _fetch_mode() == "playwright" else FETCH_WORKERS
+        fetched = fetch_all(
+            self._fetch_listing, [source.url for source in listing_sources], max_workers=workers
+        )
+        try:
+            for source, html in zip(listing_sources, fetched, strict=True):
+                try:
+                    if isinstance(html, Exception):
+                        raise html
+                    links = extract_links(html)
+                    if log:
+                        log(f"[listing] Extracted {len(links)} links from {source.domain}")
+                except Exception as exc:
+                    # A single listing source may be paywalled/blocked (401/403) or temporarily
+                    # down. Don't fail the entire listing discovery pass; just skip this source.
+                    if log:
+                        log(f"[listing] Listing failed {source.url}: {exc}")
                     continue
-                canonical = canonicalise_url(absolute)
-                if source.domain.strip().lower() == "theinsurer.com":
+                # Per-source invariants, computed once rather than for every link.
+                source_id = source.to_source().source_id
+                filter_theinsurer = source.domain.strip().lower() == "theinsurer.com"
+                snapshot_id = None
+                if mongo is not None:
+                    snapshot_id = mongo.insert_discovery_snapshot(
+                        {
+                            "source_id": source_id,
+                            "url": source.url,
+                            "fetched_at": _utc_now(),
+                            "link_count": len(links),
+                            "run_id": run_id,
+                        }
+                    )
+
+                for href, text in links:
+                    absolute = urljoin(source.url, href)
+                    if not _is_http_url(absolute):
+                        continue
+                    if not allow_external and not _same_domain(absolute, source.domain):
+                        continue
+                    canonical = canonicalise_url(absolute)
                     # TheInsurer listing pages include a lot of nav/topic links.
                     # Filter to article-like URLs to avoid wasting work downstream.
-                    if not _looks_like_theinsurer_article(canonical):
+                    if filter_theinsurer and not _looks_like_theinsurer_article(canonical):
                         continue
-                candidate_id = candidate_id_from_url(canonical)
-                if candidate_id in dedup:
-                    continue
-                dedup.add(candidate_id)
-
-                metadata = {
-                    "anchor_text": text or None,
-                    "topics": source.topics,
-                    "source_type": source.source_type,
-                    "page_type": source.page_type,
-                    "snapshot_id": snapshot_id,
-                    "run_id": run_id,
-                    "canonical_url": canonical,
-                }
-                candidate = Candidate(
-                    candidate_id=candidate_id,
-                    source_id=source.to_source().source_id,
-                    url=canonical,
-                    title=text or None,
-                    metadata=metadata,
-                )
-                candidates.append(candidate)
-                if log:
-                    log(f"[listing] Candidate {candidate.url}")
-                if postgres is not None:
-                    postgres.insert_candidate(candidate)
-
+                    candidate_id = candidate_id_from_url(canonical)
+                    if candidate_id in dedup:
+                        continue
+                    dedup.add(candidate_id)
+
+                    metadata = {
+                        "anchor_text": text or None,
+                        "topics": source.topics,
+                        "source_type": source.source_type,
+                        "page_type": source.page_type,
+                        "snapshot_id": snapshot_id,
+                        "run_id": run_id,
+                        "canonical_url": canonical,
+                    }
+                    candidate = Candidate(
+                        candidate_id=candidate_id,
+                        source_id=source_id,
+                        url=canonical,
+                        title=text or None,
+                        metadata=metadata,
+                    )
+                    candidates.append(candidate)
+                    if log:
+                        log(f"[listing] Candidate {candidate.url}")
+        finally:
+            # One connection and a handful of transactions instead of one per candidate.
+            # Flush even if a later source raises, so earlier sources stay persisted.
+            if postgres is not None:
+                postgres.insert_candidates(candidates)
         return candidates
 
     def _fetch_listing(self, url: str) -> str:
-        mode = (os.environ.get("LLOYDS_DIGEST_DISCOVERY_FETCHER") or "httpx").strip().lower()
-        if mode == "playwright":
+        if _fetch_mode() == "playwright":
             return self._fetch_listing_playwright(url)
         return self._fetch_listing_httpx(url)
 
     def _fetch_listing_httpx(self, url: str) -> str:
-        with httpx.Client(
-            timeout=self.timeout,
-            headers={"User-Agent": "lloyds-digest/0.1"},
-            follow_redirects=True,
-        ) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            return response.text
+        response = shared_client().get(url, timeout=self.timeout, follow_redirects=True)
+        response.raise_for_status()
+        return response.text
 
     def _fetch_listing_playwright(self, url: str) -> str:
         # Optional dependency; only used when explicitly enabled via env.
@@ -198,8 +222,15 @@ class ListingDiscoverer:
             return html
 
 
+def _fetch_mode() -> str:
+    return (os.environ.get("LLOYDS_DIGEST_DISCOVERY_FETCHER") or "httpx").strip().lower()
+
+
 def _same_domain(url: str, domain: str) -> bool:
-    netloc = urlsplit(url).netloc.lower()
+    # Only called on http(s) URLs, so the netloc runs from "://" to the first "/", "?" or "#".
+    start = url.find("://") + 3
+    end = _NETLOC_END_RE.search(url, start)
+    netloc = url[start : end.start() if end else len(url)].lower()
     domain = domain.lower()
     if netloc == domain:
         return True
@@ -207,8 +238,10 @@ def _same_domain(url: str, domain: str) -> bool:
 
 
 def _is_http_url(url: str) -> bool:
-    scheme = urlsplit(url).scheme
-    return scheme in {"http", "https"}
+    return url[:8].lower().startswith(("http://", "https://"))
+
+
+_NETLOC_END_RE = re.compile(r"[/?#]")
 
 
 _THEINSURER_ARTICLE_RE = re.compile(
@@ -4,9 +4,9 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Callable, Iterable
 import feedparser
-import httpx
 
 from lloyds_digest.discovery.csv_loader import CsvSourceRow
+from lloyds_digest.discovery.http_client import fetch_all, shared_client
 from lloyds_digest.discovery.url_utils import candidate_id_from_url, canonicalise_url
 from lloyds_digest.models import Candidate
 from lloyds_digest.storage.mongo_repo import MongoRepo
@@ -28,51 +28,58 @@ class RSSDiscoverer:
     ) -> list[Candidate]:
         candidates: list[Candidate] = []
         dedup = seen if seen is not None else set()
-        for source in sources:
-            if source.page_type != "rss":
-                continue
-            try:
-                if log:
-                    log(f"[rss] Fetching feed {source.url}")
-                feed_content = self._fetch_feed(source.url)
-                parsed = feedparser.parse(feed_content)
-                if log:
-                    log(f"[rss] Parsed {len(parsed.entries)} entries from {source.domain}")
-            except Exception as exc:
-                # Some RSS feeds are intermittently down or rate-limited; keep the run moving.
-                if log:
-                    log(f"[rss] Feed failed {source.url}: {exc}")
-                continue
-            snapshot_id = None
-            if mongo is not None:
-                snapshot_id = mongo.insert_discovery_snapshot(
-                    {
-                        "source_id": source.to_source().source_id,
-                        "url": source.url,
-                        "fetched_at": _utc_now(),
-                        "entry_count": len(parsed.entries),
-                        "feed": _safe_feed_summary(parsed),
-                        "run_id": run_id,
-                    }
-                )
-
-            parsed_candidates = parse_feed_entries(parsed, source, snapshot_id, run_id)
-            for candidate in parsed_candidates:
-                if candidate.candidate_id in dedup:
+        rss_sources = [source for source in sources if source.page_type == "rss"]
+        if log:
+            for source in rss_sources:
+                log(f"[rss] Fetching feed {source.url}")
+        # Fetch every feed up front so network round-trips overlap; results
+        # are then processed in source order, keeping dedup deterministic.
+        fetched = fetch_all(self._fetch_feed, [source.url for source in rss_sources])
+        try:
+            for source, feed_content in zip(rss_sources, fetched, strict=True):
+                try:
+                    if isinstance(feed_content, Exception):
+                        raise feed_content
+                    parsed = feedparser.parse(feed_content)
+                    if log:
+                        log(f"[rss] Parsed {len(parsed.entries)} entries from {source.domain}")
+                except Exception as exc:
+                    # Some RSS feeds are intermittently down or rate-limited; keep the run moving.
+                    if log:
+                        log(f"[rss] Feed failed {source.url}: {exc}")
                     continue
-                dedup.add(candidate.candidate_id)
-                candidates.append(candidate)
-                if log:
-                    log(f"[rss] Candidate {candidate.url}")
-                if postgres is not None:
-                    postgres.insert_candidate(candidate)
+                snapshot_id = None
+                if mongo is not None:
+                    snapshot_id = mongo.insert_discovery_snapshot(
+                        {
+                            "source_id": source.to_source().source_id,
+                            "url": source.url,
+                            "fetched_at": _utc_now(),
+                            "entry_count": len(parsed.entries),
+                            "feed": _safe_feed_summary(parsed),
+                            "run_id": run_id,
+                        }
+                    )
+
+                parsed_candidates = parse_feed_entries(parsed, source, snapshot_id, run_id)
+                for candidate in parsed_candidates:
+                    if candidate.candidate_id in dedup:
+                        continue
+                    dedup.add(candidate.candidate_id)
+                    candidates.append(candidate)
+                    if log:
+                        log(f"[rss] Candidate {candidate.url}")
+        finally:
+            # One connection and a handful of transactions instead of one per candidate.
+            # Flush even if a later source raises, so earlier sources stay persisted.
+            if postgres is not None:
+                postgres.insert_candidates(candidates)
         return candidates
 
     def _fetch_feed(self, url: str) -> bytes:
-        with httpx.Client(timeout=self.timeout, headers={"User-Agent": "lloyds-digest/0.1"}) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            return response.content
+        response = shared_client().get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.content
 
 
 def parse_feed_entries(
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import hashlib
+from functools import lru_cache
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 
 UTM_PREFIX = "utm_"
 
+# Listing pages repeat nav/footer links across sources; both helpers
+# are pure functions of the URL string, so repeat URLs are answered from cache.
+_URL_CACHE_SIZE = 1 << 16
+_HTTP_PREFIXES = ("http://", "https://")
+_EMPTY_NETLOC_PREFIXES = ("http:///", "https:///")
 
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
 def canonicalise_url(url: str) -> str:
+    if _is_already_canonical(url):
+        return url
     parts = urlsplit(url)
     query_pairs = [
         (key, value)
@@ -19,5 +29,22 @@ def canonicalise_url(url: str) -> str:
     return urlunsplit(normalized)
 
 
+@lru_cache(maxsize=_URL_CACHE_SIZE)
 def candidate_id_from_url(url: str) -> str:
     return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _is_already_canonical(url: str) -> bool:
+    # Most article links carry no query or fragment, and a plain ASCII
+    # http(s) URL then round-trips through urlsplit/urlunsplit unchanged.
+    # Anything urlsplit would rewrite or reject takes the full path.
+    return (
+        "?" not in url
+        and "#" not in url
+        and url.startswith(_HTTP_PREFIXES)
+        and not url.startswith(_EMPTY_NETLOC_PREFIXES)
+        and url.isascii()
+        and url.isprintable()
+        and "[" not in url
+        and "]" not in url
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timezone, timedelta
 import time
@@ -9,6 +10,7 @@ from pathlib import Path
 from typing import Callable, Iterable, Optional
 from uuid import uuid4
 
+from lloyds_digest.ai.base import build_cache_key, prefetch_ai_cache
 from lloyds_digest.boilerplate import BoilerplateRules, load_rules, strip_boilerplate
 from lloyds_digest.config import AppConfig
 from lloyds_digest.discovery.csv_loader import load_sources_csv, upsert_sources
@@ -175,57 +177,64 @@ def run_pipeline(
     }
     fetch_results = []
     total_candidates = len(candidates)
-    for idx, candidate in enumerate(candidates, start=1):
-        if skip_seen:
-            if postgres is not None and postgres.has_article(candidate.candidate_id):
-                detail(f"[{idx}/{total_candidates}] Skip existing article {candidate.url}")
-                continue
-            if postgres is None and mongo is not None:
-                if mongo.get_winner(candidate.candidate_id):
+    # Runs the classify stage alongside summarise for each article; closed with the run.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm") as llm_executor:
+        for idx, candidate in enumerate(candidates, start=1):
+            if skip_seen:
+                if postgres is not None and postgres.has_article(candidate.candidate_id):
                     detail(f"[{idx}/{total_candidates}] Skip existing article {candidate.url}")
                     continue
-        detail(f"[{idx}/{total_candidates}] Fetching {candidate.url}")
-        fetch_start = time.time()
-        result = fetcher.fetch(candidate.url, cache_backend)
-        timing_totals["fetch_ms"] += int((time.time() - fetch_start) * 1000)
-        fetch_results.append(result)
-        if result.error or not result.content:
-            metrics.errors += 1
-            detail(f"[{idx}/{total_candidates}] Fetch failed {candidate.url}")
-            continue
-        # PDFs aren't supported yet; skip now and revisit with a PDF extractor (pypdf/pdfplumber)
-        # when we decide how to handle binary documents in the digest.
-        if _looks_like_pdf(result.url, result.content):
-            metrics.notes["pdf_skipped"] = int(metrics.notes.get("pdf_skipped", 0)) + 1
-            warnings.append(f"Skipped PDF content: {candidate.url}")
-            detail(f"[{idx}/{total_candidates}] Skipped PDF {candidate.url}")
-            continue
-        metrics.fetched += 1
-        html = result.content.decode("utf-8", errors="ignore") if isinstance(result.content, bytes) else result.content
-        detail(f"[{idx}/{total_candidates}] Extracting {candidate.url}")
-        extract_start = time.time()
-        article = extraction_engine.run(candidate, html, postgres=postgres, mongo=mongo)
-        timing_totals["extract_ms"] += int((time.time() - extract_start) * 1000)
-        if article is None:
-            detail(f"[{idx}/{total_candidates}] No extractable content {candidate.url}")
-            continue
-        metrics.extracted += 1
-        digest_items.extend(
-            _article_to_items(
-                candidate,
-                article,
-                run_id=run_id,
-                postgres=postgres,
-                mongo=mongo,
-                warnings=warnings,
-                log=detail,
-                boilerplate_rules=boilerplate_rules,
-                keyword_rules=keyword_rules,
-                keyword_min_score=config.filters.keyword_min_score,
-                config=config,
-                timing_totals=timing_totals,
+                if postgres is None and mongo is not None:
+                    if mongo.get_winner(candidate.candidate_id):
+                        detail(f"[{idx}/{total_candidates}] Skip existing article {candidate.url}")
+                        continue
+            detail(f"[{idx}/{total_candidates}] Fetching {candidate.url}")
+            fetch_start = time.time()
+            result = fetcher.fetch(candidate.url, cache_backend)
+            timing_totals["fetch_ms"] += int((time.time() - fetch_start) * 1000)
+            fetch_results.append(result)
+            if result.error or not result.content:
+                metrics.errors += 1
+                detail(f"[{idx}/{total_candidates}] Fetch failed {candidate.url}")
+                continue
+            # PDFs aren't supported yet; skip now and revisit with a PDF extractor
+            # (pypdf/pdfplumber) when we decide how to handle binary documents in the digest.
+            if _looks_like_pdf(result.url, result.content):
+                metrics.notes["pdf_skipped"] = int(metrics.notes.get("pdf_skipped", 0)) + 1
+                warnings.append(f"Skipped PDF content: {candidate.url}")
+                detail(f"[{idx}/{total_candidates}] Skipped PDF {candidate.url}")
+                continue
+            metrics.fetched += 1
+            html = (
+                result.content.decode("utf-8", errors="ignore")
+                if isinstance(result.content, bytes)
+                else result.content
+            )
+            detail(f"[{idx}/{total_candidates}] Extracting {candidate.url}")
+            extract_start = time.time()
+            article = extraction_engine.run(candidate, html, postgres=postgres, mongo=mongo)
+            timing_totals["extract_ms"] += int((time.time() - extract_start) * 1000)
+            if article is None:
+                detail(f"[{idx}/{total_candidates}] No extractable content {candidate.url}")
+                continue
+            metrics.extracted += 1
+            digest_items.extend(
+                _article_to_items(
+                    candidate,
+                    article,
+                    run_id=run_id,
+                    postgres=postgres,
+                    mongo=mongo,
+                    warnings=warnings,
+                    log=detail,
+                    boilerplate_rules=boilerplate_rules,
+                    keyword_rules=keyword_rules,
+                    keyword_min_score=config.filters.keyword_min_score,
+                    config=config,
+                    timing_totals=timing_totals,
+                    llm_executor=llm_executor,
+                )
             )
-        )
 
     metrics.ended_at = _utc_now()
 
@@ -492,6 +501,7 @@ def _article_to_items(
     keyword_min_score: float,
     config: AppConfig,
     timing_totals: dict[str, int],
+    llm_executor: ThreadPoolExecutor,
 ) -> list[DigestItem]:
     topics = candidate.metadata.get("topics") if candidate.metadata else None
     topic = ", ".join(topics) if isinstance(topics, list) and topics else "General"
@@ -619,11 +629,22 @@ def _article_to_items(
         relevance_model = _llm_model("LLOYDS_DIGEST_LLM_RELEVANCE_MODEL", "gpt-5.4-nano")
         classify_model = _llm_model("LLOYDS_DIGEST_LLM_CLASSIFY_MODEL", "gpt-5.4-nano")
         summarise_model = _llm_model("LLOYDS_DIGEST_LLM_SUMMARISE_MODEL", "gpt-5.4-mini")
+        # Hash the article once per stage and fetch all three cache entries in one query.
+        relevance_key = build_cache_key(relevance_model, relevance_mod.PROMPT.version, text)
+        classify_key = build_cache_key(classify_model, classify_mod.PROMPT.version, text)
+        summarise_key = build_cache_key(summarise_model, summarise_mod.PROMPT.version, text)
+        prefetched = prefetch_ai_cache(mongo, [relevance_key, classify_key, summarise_key])
         relevance_result = _run_llm_stage(
             stage="relevance",
             model=relevance_model,
             prompt_version=relevance_mod.PROMPT.version,
-            call_fn=lambda: relevance_mod.relevance(text, model=relevance_model, mongo=mongo),
+            call_fn=lambda: relevance_mod.relevance(
+                text,
+                model=relevance_model,
+                mongo=mongo,
+                prefetched=prefetched,
+                key=relevance_key,
+            ),
             postgres=postgres,
             run_id=run_id,
             candidate_id=candidate.candidate_id,
@@ -652,8 +673,10 @@ def _article_to_items(
             if isinstance(confidence, (int, float)):
                 score = float(confidence)
 
+        # Classify and summarise are independent once relevance passes: run them side by side.
         log(f"[llm] classify {candidate.url}")
-        classify_result = _run_llm_stage(
+        classify_future = llm_executor.submit(
+            _run_llm_stage_collecting_warnings,
             stage="classify",
             model=classify_model,
             prompt_version=classify_mod.PROMPT.version,
@@ -661,18 +684,13 @@ def _article_to_items(
                 text,
                 model=classify_model,
                 mongo=mongo,
+                prefetched=prefetched,
+                key=classify_key,
             ),
             postgres=postgres,
             run_id=run_id,
             candidate_id=candidate.candidate_id,
-            warnings=warnings,
         )
-        if classify_result:
-            timing_totals["llm_classify_ms"] += int(classify_result.get("latency_ms") or 0)
-            parsed = classify_result.get("parsed") or {}
-            label = parsed.get("label")
-            if isinstance(label, str) and label.strip():
-                topic = label.strip()
 
         log(f"[llm] summarise {candidate.url}")
         summarise_result = _run_llm_stage(
@@ -683,12 +701,22 @@ def _article_to_items(
                 text,
                 model=summarise_model,
                 mongo=mongo,
+                prefetched=prefetched,
+                key=summarise_key,
             ),
             postgres=postgres,
             run_id=run_id,
             candidate_id=candidate.candidate_id,
             warnings=warnings,
         )
+        classify_result, classify_warnings = classify_future.result()
+        warnings.extend(classify_warnings)
+        if classify_result:
+            timing_totals["llm_classify_ms"] += int(classify_result.get("latency_ms") or 0)
+            parsed = classify_result.get("parsed") or {}
+            label = parsed.get("label")
+            if isinstance(label, str) and label.strip():
+                topic = label.strip()
         if summarise_result:
             timing_totals["llm_summarise_ms"] += int(summarise_result.get("latency_ms") or 0)
             parsed = summarise_result.get("parsed") or {}
@@ -828,6 +856,14 @@ def _run_llm_stage(
     return result
 
 
+def _run_llm_stage_collecting_warnings(**kwargs) -> tuple[dict | None, list[str]]:
+    # For stages run on a worker thread: warnings come back to the caller rather than
+    # being appended to the run's shared list off-thread.
+    stage_warnings: list[str] = []
+    result = _run_llm_stage(**kwargs, warnings=stage_warnings)
+    return result, stage_warnings
+
+
 def _llm_enabled() -> bool:
     mode = os.environ.get("LLOYDS_DIGEST_LLM_MODE", "on").strip().lower()
     return mode not in {"off", "false", "0", "no"}
@@ -905,6 +941,7 @@ def _record_llm_cost(
         cost_output_usd=output_cost,
         cost_total_usd=total_cost,
         metadata={},
+        tokens_cached_input=tokens_cached_input,
     )
     usage_date = _utc_now().date().isoformat()
     postgres.upsert_llm_cost_stage_daily(
@@ -917,6 +954,7 @@ def _record_llm_cost(
         tokens_prompt=tokens_prompt,
         tokens_completion=tokens_completion,
         cost_total_usd=total_cost,
+        tokens_cached_input=tokens_cached_input,
     )
 
 
@@ -115,3 +115,11 @@ class MongoRepo:
             return None
         doc.pop("_id", None)
         return doc
+
+    def get_ai_cache_many(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        collection = self._collection("ai_cache")
+        found: dict[str, dict[str, Any]] = {}
+        for doc in collection.find({"key": {"$in": keys}}):
+            doc.pop("_id", None)
+            found[doc["key"]] = doc
+        return found
@@ -2,13 +2,65 @@ from __future__ import annotations
 
 import json
 import os
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
-from typing import Any, Mapping
+from typing import Any
 
 from lloyds_digest.models import ArticleRecord, Candidate, RunMetrics, Source
 from lloyds_digest.scoring.method_prefs import MethodPrefs, MethodStats, select_method_prefs
 
+_UPSERT_CANDIDATE_SQL = """
+    INSERT INTO candidates (
+        candidate_id, source_id, url, title, published_at, discovered_at, metadata
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (candidate_id) DO UPDATE SET
+        title = EXCLUDED.title,
+        published_at = EXCLUDED.published_at,
+        metadata = EXCLUDED.metadata
+"""
+
+_INSERT_LLM_USAGE_SQL = """
+    INSERT INTO llm_usage (
+        run_id, candidate_id, stage, model, prompt_version, cached,
+        started_at, ended_at, latency_ms, tokens_prompt, tokens_completion, metadata
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+_INSERT_LLM_COST_CALL_SQL = """
+    INSERT INTO llm_cost_calls (
+        run_id, candidate_id, stage, provider, model, service_tier,
+        tokens_prompt, tokens_completion, tokens_cached_input,
+        cost_input_usd, cost_output_usd, cost_total_usd, metadata
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+_UPSERT_LLM_COST_STAGE_DAILY_SQL = """
+    INSERT INTO llm_cost_stage_daily (
+        usage_date, stage, provider, model, service_tier,
+        calls, tokens_prompt, tokens_completion, tokens_cached_input, cost_total_usd
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (usage_date, stage, provider, model, service_tier)
+    DO UPDATE SET
+        calls = llm_cost_stage_daily.calls + EXCLUDED.calls,
+        tokens_prompt = llm_cost_stage_daily.tokens_prompt + EXCLUDED.tokens_prompt,
+        tokens_completion = llm_cost_stage_daily.tokens_completion + EXCLUDED.tokens_completion,
+        tokens_cached_input =
+            llm_cost_stage_daily.tokens_cached_input + EXCLUDED.tokens_cached_input,
+        cost_total_usd = llm_cost_stage_daily.cost_total_usd + EXCLUDED.cost_total_usd
+"""
+
+_INSERT_RUN_PHASE_TIMING_SQL = """
+    INSERT INTO run_phase_timings (
+        run_id, phase, started_at, ended_at, duration_ms, metadata
+    )
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
 
 class PostgresConfigError(RuntimeError):
     pass
@@ -106,35 +158,23 @@ class PostgresRepo:
                 conn.commit()
 
     def insert_candidate(self, candidate: Candidate) -> None:
-        sql = """
-            INSERT INTO candidates (
-                candidate_id, source_id, url, title, published_at, discovered_at, metadata
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (candidate_id) DO UPDATE SET
-                title = EXCLUDED.title,
-                published_at = EXCLUDED.published_at,
-                metadata = EXCLUDED.metadata
-        """
-        metadata_json = json.dumps(candidate.metadata)
-        url = _sanitize_text(candidate.url)
-        title = _sanitize_text(candidate.title)
         with self._connect() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    sql,
-                    (
-                        candidate.candidate_id,
-                        candidate.source_id,
-                        url,
-                        title,
-                        candidate.published_at,
-                        candidate.discovered_at,
-                        metadata_json,
-                    ),
-                )
+                cur.execute(_UPSERT_CANDIDATE_SQL, _candidate_params(candidate))
                 conn.commit()
 
+    def insert_candidates(self, candidates: Sequence[Candidate], batch_size: int = 500) -> None:
+        # One connection for the whole discovery pass; psycopg pipelines
+        # executemany, and each batch is committed as a single transaction.
+        if not candidates:
+            return
+        with self._connect() as conn:
+            with conn.cursor() as cur:
+                for start in range(0, len(candidates), batch_size):
+                    batch = candidates[start : start + batch_size]
+                    cur.executemany(_UPSERT_CANDIDATE_SQL, [_candidate_params(c) for c in batch])
+                    conn.commit()
+
     def insert_attempt(
         self,
         candidate_id: str,
@@ -370,13 +410,7 @@ class PostgresRepo:
         tokens_completion: int | None = None,
         metadata: Mapping[str, Any] | None = None,
     ) -> None:
-        sql = """
-            INSERT INTO llm_usage (
-                run_id, candidate_id, stage, model, prompt_version, cached,
-                started_at, ended_at, latency_ms, tokens_prompt, tokens_completion, metadata
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        sql = _INSERT_LLM_USAGE_SQL
         metadata_json = json.dumps(dict(metadata or {}))
         with self._connect() as conn:
             with conn.cursor() as cur:
@@ -413,14 +447,9 @@ class PostgresRepo:
         cost_output_usd: float,
         cost_total_usd: float,
         metadata: dict | None = None,
+        tokens_cached_input: int | None = None,
     ) -> None:
-        sql = """
-            INSERT INTO llm_cost_calls (
-                run_id, candidate_id, stage, provider, model, service_tier,
-                tokens_prompt, tokens_completion, cost_input_usd, cost_output_usd, cost_total_usd, metadata
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        sql = _INSERT_LLM_COST_CALL_SQL
         metadata_json = json.dumps(metadata or {})
         with self._connect() as conn:
             with conn.cursor() as cur:
@@ -435,6 +464,7 @@ class PostgresRepo:
                         service_tier,
                         tokens_prompt,
                         tokens_completion,
+                        tokens_cached_input or 0,
                         cost_input_usd,
                         cost_output_usd,
                         cost_total_usd,
@@ -454,20 +484,9 @@ class PostgresRepo:
         tokens_prompt: int,
         tokens_completion: int,
         cost_total_usd: float,
+        tokens_cached_input: int | None = None,
     ) -> None:
-        sql = """
-            INSERT INTO llm_cost_stage_daily (
-                usage_date, stage, provider, model, service_tier,
-                calls, tokens_prompt, tokens_completion, cost_total_usd
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (usage_date, stage, provider, model, service_tier)
-            DO UPDATE SET
-                calls = llm_cost_stage_daily.calls + EXCLUDED.calls,
-                tokens_prompt = llm_cost_stage_daily.tokens_prompt + EXCLUDED.tokens_prompt,
-                tokens_completion = llm_cost_stage_daily.tokens_completion + EXCLUDED.tokens_completion,
-                cost_total_usd = llm_cost_stage_daily.cost_total_usd + EXCLUDED.cost_total_usd
-        """
+        sql = _UPSERT_LLM_COST_STAGE_DAILY_SQL
         with self._connect() as conn:
             with conn.cursor() as cur:
                 cur.execute(
@@ -481,11 +500,106 @@ class PostgresRepo:
                         calls,
                         tokens_prompt,
                         tokens_completion,
+                        tokens_cached_input or 0,
                         cost_total_usd,
                     ),
                 )
             conn.commit()
 
+    def record_llm_call(
+        self,
+        run_id: str | None,
+        candidate_id: str | None,
+        stage: str,
+        provider: str,
+        model: str,
+        prompt_version: str,
+        service_tier: str | None,
+        started_at: datetime,
+        ended_at: datetime | None,
+        latency_ms: int | None,
+        tokens_prompt: int,
+        tokens_completion: int,
+        cost: tuple[float, float, float] | None,
+        usage_date: str,
+        cached: bool = False,
+        metadata: Mapping[str, Any] | None = None,
+        phase_timing: tuple[str, datetime, datetime] | None = None,
+        tokens_cached_input: int | None = None,
+    ) -> None:
+        # Same rows as insert_llm_usage + insert_llm_cost_call + upsert_llm_cost_stage_daily
+        # (and insert_run_phase_timing when phase_timing is given), written over one
+        # connection and committed once.
+        metadata_json = json.dumps(dict(metadata or {}))
+        with self._connect() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    _INSERT_LLM_USAGE_SQL,
+                    (
+                        run_id,
+                        candidate_id,
+                        stage,
+                        model,
+                        prompt_version,
+                        cached,
+                        started_at,
+                        ended_at,
+                        latency_ms,
+                        tokens_prompt,
+                        tokens_completion,
+                        metadata_json,
+                    ),
+                )
+                if cost is not None:
+                    input_cost, output_cost, total_cost = cost
+                    cur.execute(
+                        _INSERT_LLM_COST_CALL_SQL,
+                        (
+                            run_id,
+                            candidate_id,
+                            stage,
+                            provider,
+                            model,
+                            service_tier,
+                            tokens_prompt,
+                            tokens_completion,
+                            tokens_cached_input or 0,
+                            input_cost,
+                            output_cost,
+                            total_cost,
+                            metadata_json,
+                        ),
+                    )
+                    cur.execute(
+                        _UPSERT_LLM_COST_STAGE_DAILY_SQL,
+                        (
+                            usage_date,
+                            stage,
+                            provider,
+                            model,
+                            service_tier,
+                            1,
+                            tokens_prompt,
+                            tokens_completion,
+                            tokens_cached_input or 0,
+                            total_cost,
+                        ),
+                    )
+                if phase_timing is not None and run_id:
+                    phase, phase_started_at, phase_ended_at = phase_timing
+                    cur.execute(
+                        _INSERT_RUN_PHASE_TIMING_SQL,
+                        (
+                            run_id,
+                            phase,
+                            phase_started_at,
+                            phase_ended_at,
+                            int((phase_ended_at - phase_started_at).total_seconds() * 1000),
+                            metadata_json,
+                        ),
+                    )
+            conn.commit()
+
     def insert_run_phase_timing(
         self,
         run_id: str,
@@ -495,12 +609,7 @@ class PostgresRepo:
         ended_at: datetime | None = None,
         metadata: dict | None = None,
     ) -> None:
-        sql = """
-            INSERT INTO run_phase_timings (
-                run_id, phase, started_at, ended_at, duration_ms, metadata
-            )
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
+        sql = _INSERT_RUN_PHASE_TIMING_SQL
         metadata_json = json.dumps(metadata or {})
         with self._connect() as conn:
             with conn.cursor() as cur:
@@ -582,3 +691,15 @@ def _sanitize_text(value: str | None) -> str | None:
     if value is None:
         return None
     return value.replace("\x00", "")
+
+
+def _candidate_params(candidate: Candidate) -> tuple[Any, ...]:
+    return (
+        candidate.candidate_id,
+        candidate.source_id,
+        _sanitize_text(candidate.url),
+        _sanitize_text(candidate.title),
+        candidate.published_at,
+        candidate.discovered_at,
+        json.dumps(candidate.metadata),
+    )
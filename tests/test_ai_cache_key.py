@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from lloyds_digest.ai.base import build_cache_key, normalize_cache_content
+import importlib
+
+import pytest
+
+import lloyds_digest.ai.base as ai_base
+from lloyds_digest.ai.base import build_cache_key, cached_call, normalize_cache_content
 
 
 def test_ai_cache_key_changes_with_version() -> None:
@@ -17,3 +22,49 @@ def test_ai_cache_key_ignores_whitespace_noise() -> None:
 
 def test_normalize_cache_content_collapses_whitespace() -> None:
     assert normalize_cache_content("  a\tb\nc  ") == "a b c"
+
+
+class _CountingMongo:
+    def __init__(self) -> None:
+        self.lookups = 0
+        self.upserts: list[str] = []
+
+    def get_ai_cache(self, key: str) -> dict | None:
+        self.lookups += 1
+        return None
+
+    def upsert_ai_cache(self, key: str, payload: dict) -> None:
+        self.upserts.append(key)
+
+
+def test_cached_call_uses_prefetched_entries_without_lookup() -> None:
+    mongo = _CountingMongo()
+    prefetched = {"hit": {"response": "{}"}}
+
+    hit = cached_call(mongo, "hit", lambda: {"response": "fresh"}, prefetched)
+    miss = cached_call(mongo, "miss", lambda: {"response": "fresh"}, prefetched)
+
+    assert hit == {"cached": True, "payload": {"response": "{}"}}
+    assert miss == {"cached": False, "payload": {"response": "fresh"}}
+    assert mongo.lookups == 0
+    assert mongo.upserts == ["miss"]
+
+
+def test_stage_uses_precomputed_key_without_rehashing(monkeypatch: pytest.MonkeyPatch) -> None:
+    summarise_mod = importlib.import_module("lloyds_digest.ai.summarise")
+    monkeypatch.setattr(ai_base, "_read_prompt", lambda _filename: "Summarise.")
+
+    def _no_hash(*_args: object) -> str:
+        raise AssertionError("cache key should not be recomputed")
+
+    monkeypatch.setattr(summarise_mod, "build_cache_key", _no_hash)
+    mongo = _CountingMongo()
+    prefetched = {"precomputed": {"response": '{"bullets": ["a"]}', "tokens_cached_prompt": 5}}
+
+    result = summarise_mod.summarise(
+        "body", model="gpt-5-mini", mongo=mongo, prefetched=prefetched, key="precomputed"
+    )
+
+    assert result["cached"] is True
+    assert result["parsed"] == {"bullets": ["a"]}
+    assert mongo.upserts == []
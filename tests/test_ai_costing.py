@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import pytest
+
+import lloyds_digest.ai.base as ai_base
+from lloyds_digest import pipeline
 from lloyds_digest.ai.costing import compute_cost_usd
 
 
@@ -24,3 +28,42 @@ def test_flex_cached_input_pricing_applies_cached_rate() -> None:
     )
     assert cost == (0.0125, 0.0, 0.0125)
 
+
+
+def test_cached_prompt_tokens_reach_cost_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    classify_mod = pipeline.classify_mod
+    monkeypatch.setattr(ai_base, "_read_prompt", lambda _filename: "Classify.")
+
+    def _generate(self, prompt: str) -> dict:
+        return {"response": '{"topic": "market"}', "usage": (1_000, 50, 800)}
+
+    monkeypatch.setattr(classify_mod.OpenAIClient, "generate", _generate)
+
+    class _RecordingPostgres:
+        def __init__(self) -> None:
+            self.cost_calls: list[dict] = []
+
+        def insert_llm_usage(self, **kwargs) -> None:
+            pass
+
+        def insert_llm_cost_call(self, **kwargs) -> None:
+            self.cost_calls.append(kwargs)
+
+        def upsert_llm_cost_stage_daily(self, **kwargs) -> None:
+            pass
+
+    postgres = _RecordingPostgres()
+    warnings: list[str] = []
+    pipeline._run_llm_stage(
+        "classify",
+        "gpt-5-mini",
+        classify_mod.PROMPT.version,
+        lambda: classify_mod.classify("body", model="gpt-5-mini"),
+        postgres,  # type: ignore[arg-type]
+        "run-1",
+        "cand-1",
+        warnings,
+    )
+
+    assert warnings == []
+    assert [call["tokens_cached_input"] for call in postgres.cost_calls] == [800]
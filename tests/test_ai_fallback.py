@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 
 import pytest
@@ -27,17 +28,8 @@ class _DummyResponse:
 class _DummyClient:
     calls: list[dict] = []
 
-    def __init__(self, timeout: float):
-        self.timeout = timeout
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):
-        return False
-
-    def post(self, url: str, headers: dict, json: dict):
-        self.calls.append({"url": url, "headers": headers, "json": dict(json)})
+    def post(self, url: str, headers: dict, content: bytes, timeout: float):
+        self.calls.append({"url": url, "headers": headers, "json": json.loads(content)})
         if len(self.calls) == 1:
             return _DummyResponse(429, "resource_unavailable")
         return _DummyResponse(
@@ -53,7 +45,7 @@ class _DummyClient:
 def test_post_openai_chat_completion_falls_back_to_standard(monkeypatch: pytest.MonkeyPatch) -> None:
     dummy = _DummyClient
     dummy.calls = []
-    monkeypatch.setattr(ai_base.httpx, "Client", dummy)
+    monkeypatch.setattr(ai_base, "_http_client", lambda: dummy())
 
     result = ai_base.post_openai_chat_completion(
         "hello",
@@ -69,3 +61,96 @@ def test_post_openai_chat_completion_falls_back_to_standard(monkeypatch: pytest.
     assert len(dummy.calls) == 2
     assert dummy.calls[0]["json"]["service_tier"] == "flex"
     assert dummy.calls[1]["json"]["service_tier"] == "standard"
+
+
+class _UnauthorizedClient:
+    calls: int = 0
+
+    def post(self, url: str, headers: dict, content: bytes, timeout: float):
+        _UnauthorizedClient.calls += 1
+        return _DummyResponse(401, "invalid_api_key")
+
+
+def test_post_openai_chat_completion_does_not_retry_client_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _UnauthorizedClient.calls = 0
+    monkeypatch.setattr(ai_base, "_http_client", lambda: _UnauthorizedClient())
+
+    with pytest.raises(ai_base.httpx.HTTPStatusError) as excinfo:
+        ai_base.post_openai_chat_completion(
+            "hello",
+            model="gpt-5-mini",
+            api_key="bad",
+            service_tier="standard",
+            fallback_tier="standard",
+            timeout=1.0,
+            system_prompt="Return JSON only, no markdown.",
+            max_attempts=3,
+        )
+
+    assert _UnauthorizedClient.calls == 1
+    assert not ai_base.is_retryable_openai_error(excinfo.value)
+
+
+def test_post_openai_chat_completion_streams_deltas(monkeypatch: pytest.MonkeyPatch) -> None:
+    events = [
+        {"choices": [{"delta": {"role": "assistant"}}]},
+        {"choices": [{"delta": {"content": "Hello"}}]},
+        {"choices": [{"delta": {"content": " world"}}]},
+        {"choices": [], "usage": {"prompt_tokens": 12, "completion_tokens": 2}},
+    ]
+    sse = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+
+    def handler(request: ai_base.httpx.Request) -> ai_base.httpx.Response:
+        assert json.loads(request.content)["stream"] is True
+        return ai_base.httpx.Response(200, text=sse, headers={"Content-Type": "text/event-stream"})
+
+    client = ai_base.httpx.Client(transport=ai_base.httpx.MockTransport(handler))
+    monkeypatch.setattr(ai_base, "_http_client", lambda: client)
+    deltas: list[str] = []
+
+    result = ai_base.post_openai_chat_completion(
+        "hello",
+        model="gpt-5-mini",
+        api_key="key",
+        service_tier="standard",
+        fallback_tier="standard",
+        timeout=1.0,
+        system_prompt="Reply briefly.",
+        on_delta=deltas.append,
+    )
+
+    assert deltas == ["Hello", " world"]
+    assert result["data"]["choices"][0]["message"]["content"] == "Hello world"
+    assert result["data"]["usage"]["prompt_tokens"] == 12
+
+
+def test_openai_client_generate_reuses_shared_http_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[str] = []
+
+    def handler(request: ai_base.httpx.Request) -> ai_base.httpx.Response:
+        requests.append(json.loads(request.content)["messages"][1]["content"])
+        return ai_base.httpx.Response(
+            200,
+            json={
+                "choices": [{"message": {"content": '{"ok": true}'}}],
+                "usage": {
+                    "prompt_tokens": 9,
+                    "completion_tokens": 3,
+                    "prompt_tokens_details": {"cached_tokens": 4},
+                },
+            },
+        )
+
+    client = ai_base.httpx.Client(transport=ai_base.httpx.MockTransport(handler))
+    monkeypatch.setattr(ai_base, "_http_client", lambda: client)
+    openai = ai_base.OpenAIClient(model="gpt-5-mini", api_key="key", service_tier="standard")
+
+    first = openai.generate("one")
+    second = openai.generate("two")
+
+    assert requests == ["one", "two"]
+    assert first["response"] == second["response"] == '{"ok": true}'
+    assert first["usage"] == (9, 3, 4)
+    assert not client.is_closed
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from lloyds_digest.ai.base import safe_json
+
+
+def test_safe_json_parses_objects_only() -> None:
+    assert safe_json(' {"label": "market"}\n') == {"label": "market"}
+    assert safe_json("[1, 2]") == {}
+    assert safe_json('```json\n{"label": "market"}\n```') == {}
+    assert safe_json('{"label": "market"} trailing') == {}
+    assert safe_json("") == {}
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from lloyds_digest.ai.base import build_cache_key
+
+_SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "render_linkedin_post.py"
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("render_linkedin_post", _SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+linkedin = _load_script()
+
+
+@pytest.fixture
+def response_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    def _configure(ttl_hours: float = 24.0) -> Path:
+        settings = linkedin.LinkedInSettings(
+            openai_api_key="",
+            model="gpt-5.4-mini",
+            service_tier="flex",
+            fallback_tier="standard",
+            timeout=1.0,
+            max_attempts=1,
+            cache_ttl_hours=ttl_hours,
+            concurrency=1,
+            pages_base_url="",
+            postgres_dsn=None,
+        )
+        monkeypatch.setattr(linkedin, "_settings", lambda: settings)
+        monkeypatch.setattr(linkedin, "RESPONSE_CACHE_DIR", tmp_path)
+        return tmp_path
+
+    return _configure
+
+
+def test_response_cache_round_trip(response_cache) -> None:
+    response_cache()
+    linkedin._write_cached_response("key", "post text")
+    assert linkedin._read_cached_response("key") == "post text"
+
+
+def test_response_cache_miss_returns_none(response_cache) -> None:
+    response_cache()
+    assert linkedin._read_cached_response("missing") is None
+
+
+def test_response_cache_entry_expires_after_ttl(response_cache) -> None:
+    cache_dir = response_cache(ttl_hours=1)
+    linkedin._write_cached_response("key", "post text")
+    stale = time.time() - 2 * 3600
+    os.utime(cache_dir / "key.txt", (stale, stale))
+    assert linkedin._read_cached_response("key") is None
+
+
+@pytest.mark.parametrize("ttl_hours", [0, -1])
+def test_response_cache_disabled_by_non_positive_ttl(response_cache, ttl_hours: float) -> None:
+    response_cache(ttl_hours=ttl_hours)
+    linkedin._write_cached_response("key", "post text")
+    assert linkedin._read_cached_response("key") is None
+
+
+def test_response_cache_skips_empty_output(response_cache) -> None:
+    cache_dir = response_cache()
+    linkedin._write_cached_response("key", "")
+    assert not (cache_dir / "key.txt").exists()
+
+
+def test_generate_reads_cache_under_build_cache_key(response_cache) -> None:
+    cache_dir = response_cache()
+    key = build_cache_key("gpt-5.4-mini", linkedin.PROMPT_VERSION, "Digest inputs")
+    (cache_dir / f"{key}.txt").write_text("cached post", encoding="utf-8")
+
+    # No API key is configured, so only a cache hit can produce output.
+    assert linkedin._generate_with_openai("Digest inputs") == ("cached post", None)
+
+
+def test_response_cache_key_format_is_stable() -> None:
+    # Cached LinkedIn responses on disk are named by this key; changing the format
+    # silently orphans them.
+    expected = hashlib.sha256(b"gpt-5.4-mini\x1fv2\x1fa b").hexdigest()
+    assert build_cache_key("gpt-5.4-mini", "v2", "a \n b") == expected
+
+
+def test_format_response_replaces_leading_todays_with_digest_date() -> None:
+    text = "today's digest: big news"
+    assert linkedin._format_linkedin_response(text, "2026-03-05") == "05-Mar's Digest: Big news"
+
+
+def test_format_response_capitalises_headings_and_after_colons() -> None:
+    text = "Intro\nwhy it matters:\nrates: softening"
+    assert (
+        linkedin._format_linkedin_response(text, "2026-03-05")
+        == "Intro\nWhy it matters: Rates: softening"
+    )
+
+
+def test_format_response_leaves_urls_after_colon_alone() -> None:
+    text = "see: https://example.com/x"
+    assert linkedin._format_linkedin_response(text, "2026-03-05") == text
+
+
+def test_format_response_heading_with_trailing_whitespace() -> None:
+    # The old line-slicing pass duplicated the first characters here ("riRisk view:").
+    text = "intro\n  risk view:  \nbody"
+    assert linkedin._format_linkedin_response(text, "2026-03-05") == "intro\n  Risk view: Body"
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import pytest
+
+from lloyds_digest.discovery import listing
 from lloyds_digest.discovery.csv_loader import CsvSourceRow
 from lloyds_digest.discovery.listing import ListingDiscoverer, extract_links
 
@@ -19,6 +22,18 @@ def test_extract_links() -> None:
     assert ("/article/1", "Article One") in links
 
 
+def test_extract_links_matches_pure_python_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    html = (
+        '<a href="/a?x=1&amp;y=2">\n  <span>Lloyd&#39;s</span> <!-- c --> <b>market</b>\n</a>'
+        '<a href="">Empty</a><a name="top">No href</a>'
+    )
+    expected = [("/a?x=1&y=2", "Lloyd's   market")]
+    assert extract_links(html) == expected
+
+    monkeypatch.setattr(listing, "_lxml_html", None)
+    assert extract_links(html) == expected
+
+
 def test_listing_discover_dedupes_and_filters() -> None:
     source = CsvSourceRow(
         source_type="primary",
@@ -34,3 +49,67 @@ def test_listing_discover_dedupes_and_filters() -> None:
 
     assert len(candidates) == 1
     assert candidates[0].url == "https://example.com/article/1"
+
+
+def test_listing_discover_writes_candidates_in_one_batch() -> None:
+    class _RecordingPostgres:
+        def __init__(self) -> None:
+            self.batches: list[list] = []
+
+        def insert_candidates(self, candidates: list) -> None:
+            self.batches.append(list(candidates))
+
+    source = CsvSourceRow(
+        source_type="primary",
+        domain="example.com",
+        url="https://example.com/listing",
+        topics=["Market"],
+        page_type="listing",
+    )
+    discoverer = ListingDiscoverer()
+    discoverer._fetch_listing = lambda _url: SAMPLE_HTML  # type: ignore[assignment]
+    postgres = _RecordingPostgres()
+
+    candidates = discoverer.discover([source], postgres=postgres)  # type: ignore[arg-type]
+
+    assert postgres.batches == [candidates]
+
+
+def test_listing_discover_flushes_candidates_when_a_later_source_fails() -> None:
+    class _RecordingPostgres:
+        def __init__(self) -> None:
+            self.batches: list[list] = []
+
+        def insert_candidates(self, candidates: list) -> None:
+            self.batches.append(list(candidates))
+
+    class _FlakyMongo:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def insert_discovery_snapshot(self, payload: dict) -> str:
+            self.calls += 1
+            if self.calls > 1:
+                raise RuntimeError("mongo down")
+            return "snap-1"
+
+    sources = [
+        CsvSourceRow(
+            source_type="primary",
+            domain="example.com",
+            url=f"https://example.com/listing/{idx}",
+            topics=["Market"],
+            page_type="listing",
+        )
+        for idx in range(2)
+    ]
+    discoverer = ListingDiscoverer()
+    discoverer._fetch_listing = lambda _url: SAMPLE_HTML  # type: ignore[assignment]
+    postgres = _RecordingPostgres()
+
+    with pytest.raises(RuntimeError, match="mongo down"):
+        discoverer.discover(sources, postgres=postgres, mongo=_FlakyMongo())  # type: ignore[arg-type]
+
+    assert [[c.url for c in batch] for batch in postgres.batches] == [
+        ["https://example.com/article/1"]
+    ]
@@ -76,3 +76,37 @@ def test_rss_discover_dedupes() -> None:
 
     candidates = discoverer.discover([source])
     assert len(candidates) == 1
+
+
+def test_rss_discover_skips_failed_feed_and_keeps_source_order() -> None:
+    sources = [
+        CsvSourceRow(
+            source_type="primary",
+            domain=domain,
+            url=f"https://{domain}/feed",
+            topics=["Lloyds"],
+            page_type="rss",
+        )
+        for domain in ("down.com", "example.com", "example.org")
+    ]
+    feeds = {
+        "https://example.com/feed": SAMPLE_RSS_SINGLE,
+        "https://example.org/feed": SAMPLE_RSS_SINGLE.replace("example.com", "example.org"),
+    }
+
+    def _fetch(url: str) -> bytes:
+        if url not in feeds:
+            raise RuntimeError("feed down")
+        return feeds[url].encode("utf-8")
+
+    discoverer = RSSDiscoverer()
+    discoverer._fetch_feed = _fetch  # type: ignore[assignment]
+    logs: list[str] = []
+
+    candidates = discoverer.discover(sources, log=logs.append)
+
+    assert [c.url for c in candidates] == [
+        "https://example.com/article",
+        "https://example.org/article",
+    ]
+    assert "[rss] Feed failed https://down.com/feed: feed down" in logs
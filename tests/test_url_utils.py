@@ -6,3 +6,10 @@ from lloyds_digest.discovery.url_utils import canonicalise_url
 def test_canonicalise_url_strips_utm_and_fragment() -> None:
     url = "https://example.com/path?utm_source=abc&utm_campaign=test&keep=1#section"
     assert canonicalise_url(url) == "https://example.com/path?keep=1"
+
+
+def test_canonicalise_url_keeps_plain_urls_and_normalises_the_rest() -> None:
+    assert canonicalise_url("https://example.com/news/a-story") == "https://example.com/news/a-story"
+    assert canonicalise_url("HTTPS://example.com/news") == "https://example.com/news"
+    assert canonicalise_url("https://example.com/news?") == "https://example.com/news"
+    assert canonicalise_url("https://example.com/news?a=b c") == "https://example.com/news?a=b+c"